@@ -1,69 +1,377 @@
 import os
 import sys
+import queue
+import atexit
 import logging
 import datetime
+import threading
 from pathlib import Path
 from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+
+
+# A batch is written once it holds this many bytes or messages,
+# or when no new message arrives within BATCH_IDLE seconds
+BATCH_BYTES = 1 << 16
+BATCH_MESSAGES = 100
+BATCH_IDLE = 0.005
+# Writing a message that contains one of these level fields, as DEFAULT_FORMAT
+# renders them, blocks until it is on disk
+URGENT_MARKERS = (" - ERROR - ", " - CRITICAL - ")
+# Maximum number of in-flight writes of the io_uring file backend
+IOURING_DEPTH = 64
+
+
+def _write_all(fd, data):
+    """Write all of data to a file descriptor, retrying on short writes"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _writev_all(fd, frags, size):
+    """Write a list of byte strings (size bytes in total) with one writev call where available"""
+    if hasattr(os, "writev"):
+        written = os.writev(fd, frags)
+        if written == size:
+            return
+        data = b"".join(frags)[written:]
+    else:
+        data = b"".join(frags)
+    _write_all(fd, data)
+
+
+class _IoUringWriter:
+    """
+    Writes batches to a file through io_uring (Linux only, needs the `liburing` package).
+    
+    Every batch is submitted at an explicit file offset, so up to `depth` writes
+    can be in flight while the consumer collects the next batch.
+    """
+    def __init__(self, fd, depth=IOURING_DEPTH):
+        import liburing
+        
+        self._uring = liburing
+        self._ring = liburing.Ring()
+        self._cqe = liburing.Cqe()
+        liburing.io_uring_queue_init(depth, self._ring)
+        self._fd = fd
+        self._depth = depth
+        self.offset = 0
+        self._next_id = 0
+        # Submitted buffers by id, kept alive until their write completes
+        self._inflight = {}
+
+    def write(self, data):
+        """Submit data for writing at the current end of the file"""
+        while len(self._inflight) >= self._depth:
+            self._reap(wait=True)
+        
+        sqe = self._uring.io_uring_get_sqe(self._ring)
+        self._uring.io_uring_prep_write(sqe, self._fd, data, self.offset)
+        self._uring.io_uring_sqe_set_data64(sqe, self._next_id)
+        self._inflight[self._next_id] = (data, self.offset)
+        self.offset += len(data)
+        self._next_id += 1
+        self._uring.io_uring_submit(self._ring)
+        self._reap(wait=False)
+
+    def _reap(self, wait):
+        """Handle finished writes; with wait=True block until at least one finishes"""
+        while self._inflight:
+            try:
+                if wait:
+                    self._uring.io_uring_wait_cqe(self._ring, self._cqe)
+                    wait = False
+                else:
+                    self._uring.io_uring_peek_cqe(self._ring, self._cqe)
+            except BlockingIOError:
+                return
+            cqe = self._cqe[0]
+            res, write_id = cqe.res, cqe.user_data
+            self._uring.io_uring_cqe_seen(self._ring, cqe)
+            
+            data, offset = self._inflight.pop(write_id)
+            if res < 0:
+                raise OSError(-res, os.strerror(-res))
+            # Finish short writes synchronously
+            view = memoryview(data)[res:]
+            offset += res
+            while view:
+                written = os.pwrite(self._fd, view, offset)
+                view = view[written:]
+                offset += written
+
+    def drain(self):
+        """Block until every submitted write has completed"""
+        while self._inflight:
+            self._reap(wait=True)
+
+    def close(self):
+        """Wait for pending writes and release the ring"""
+        try:
+            self.drain()
+        finally:
+            self._uring.io_uring_queue_exit(self._ring)
+
+
+class _Marker:
+    """Queue marker that is set once every message queued before it is written"""
+    __slots__ = ("done", "stop")
+
+    def __init__(self, stop=False):
+        self.done = threading.Event()
+        self.stop = stop
 
 
 class TeeLogger:
     """
     A class that duplicates output to both the terminal and a log file.
     Useful for capturing print statements in scripts and notebooks.
+    
+    Messages are handed to a background thread through a queue, so `write`
+    only costs a queue put; the thread does the terminal and file I/O.
     """
-    def __init__(self, filename, logs_dirpath="logs"):
+    def __init__(self, filename, logs_dirpath="logs", backend="os"):
         """
         Initialize the TeeLogger with a filename and optional log directory.
         
+        Queued messages are batched (up to 64 KiB, 100 messages or 5 ms of
+        idle time) and each batch goes to the terminal and the log file with
+        a single writev call each.
+        
         Args:
             filename (str): Name of the log file
             log_dir (str, optional): Directory to store log files. Defaults to "logs".
+            backend (str, optional): How batches reach the log file: "os" (writev) or
+                "iouring" (io_uring via the `liburing` package, Linux only; falls back
+                to "os" if unavailable). Defaults to "os".
         """
+        if backend not in ("os", "iouring"):
+            raise ValueError(f"Unknown TeeLogger backend: {backend}")
+
         # Create logs directory if it doesn't exist
         Path(logs_dirpath).mkdir(exist_ok=True)
         
         # Create full path for log file
         self.log_path = str(Path(logs_dirpath) / filename)
         self.terminal = sys.stdout
-        self.log_file = open(self.log_path, 'w', encoding='utf-8')
+        # Raw descriptor, no file object layers: the consumer does its own batching.
+        # io_uring writes at explicit offsets, so only the writev path appends
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        if backend == "os":
+            flags |= os.O_APPEND
+        self.log_fd = os.open(self.log_path, flags, 0o644)
+        self._file_writer = None
+        if backend == "iouring":
+            try:
+                self._file_writer = _IoUringWriter(self.log_fd)
+            except (ImportError, AttributeError, OSError) as e:
+                print(f"io_uring backend unavailable ({e}), using os.writev", file=sys.__stderr__)
+        
+        # Background consumer doing all terminal and file I/O; once it is stopped,
+        # write() falls back to synchronous writes (guarded by _stop_lock)
+        self._closed = False
+        self._stopped = False
+        self._stop_lock = threading.Lock()
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._consume, name="TeeLogger", daemon=True)
+        self._thread.start()
+        # Make sure queued output reaches the file on interpreter exit. The file stays
+        # open, so output of later atexit handlers is still written to it
+        atexit.register(self._stop)
         
         print(f"Logging to: {self.log_path}")
 
+    def _terminal_fd(self):
+        """File descriptor of the terminal if raw UTF-8 bytes can go to it, else None
+        
+        Only the interpreter's own stdout/stderr qualify: other streams may have a
+        fileno() that is not where their text ends up (ipykernel's OutStream returns
+        the kernel's original stdout, i.e. the server console, not the notebook cell).
+        """
+        if self.terminal is not sys.__stdout__ and self.terminal is not sys.__stderr__:
+            return None
+        try:
+            encoding = (self.terminal.encoding or "").lower().replace("-", "")
+            if encoding != "utf8":
+                return None
+            # Anything still buffered in the stream must go out first
+            self.terminal.flush()
+            return self.terminal.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+
+    def _write_batch(self, frags, size):
+        """Write a list of encoded messages (size bytes in total) to the terminal and the log file"""
+        terminal_fd = self._terminal_fd()
+        if terminal_fd is None:
+            self.terminal.write(b"".join(frags).decode('utf-8'))
+        else:
+            _writev_all(terminal_fd, frags, size)
+        if self.log_fd is None:
+            return
+        if self._file_writer is not None:
+            offset = self._file_writer.offset
+            try:
+                self._file_writer.write(b"".join(frags))
+                return
+            except Exception as e:
+                # Rewrite this batch where it started, later batches go through writev
+                self._drop_file_writer(e, offset)
+        _writev_all(self.log_fd, frags, size)
+
+    def _drop_file_writer(self, error=None, offset=None):
+        """Close the io_uring writer and continue with writev at offset (default: its end)"""
+        writer, self._file_writer = self._file_writer, None
+        if offset is None:
+            offset = writer.offset
+        if error is not None:
+            print(f"io_uring write to {self.log_path} failed ({error}), using os.writev", file=sys.__stderr__)
+        try:
+            writer.close()
+        except Exception:
+            # Already failing, the error above is the one to report
+            if error is None:
+                raise
+        finally:
+            os.lseek(self.log_fd, offset, os.SEEK_SET)
+
+    def _consume(self):
+        """Collect queued messages into batches and write each batch with one writev per stream"""
+        while True:
+            item = self._queue.get()
+            
+            frags = []
+            size = 0
+            marker = None
+            while True:
+                if isinstance(item, _Marker):
+                    marker = item
+                    break
+                frags.append(item)
+                size += len(item)
+                if size >= BATCH_BYTES or len(frags) >= BATCH_MESSAGES:
+                    break
+                try:
+                    item = self._queue.get(timeout=BATCH_IDLE)
+                except queue.Empty:
+                    break
+            
+            try:
+                if frags:
+                    self._write_batch(frags, size)
+                if marker is not None:
+                    self.terminal.flush()
+                    if self._file_writer is not None:
+                        if marker.stop:
+                            # Later synchronous writes append at the current position
+                            self._drop_file_writer()
+                        else:
+                            try:
+                                self._file_writer.drain()
+                            except Exception as e:
+                                self._drop_file_writer(e)
+            except Exception as e:
+                print(f"TeeLogger failed to write to {self.log_path}: {e}", file=sys.__stderr__)
+            
+            if marker is not None:
+                marker.done.set()
+                if marker.stop:
+                    return
+
     def write(self, message):
-        """Write message to both terminal and log file"""
-        self.terminal.write(message)
-        self.log_file.write(message)
-        self.log_file.flush()
+        """Queue message for writing to both terminal and log file
+        
+        ERROR/CRITICAL records (matched on their formatted level field, not on
+        the words anywhere in the text) are written before this returns, so
+        they survive a crash right after them.
+        """
+        # The encoded bytes are queued as they are, the consumer hands them straight to writev
+        data = message.encode('utf-8', 'replace')
+        with self._stop_lock:
+            if not self._stopped:
+                self._queue.put(data)
+                data = None
+        if data is not None:
+            # Nothing consumes the queue any more (e.g. output of later atexit handlers)
+            try:
+                self._write_batch([data], len(data))
+            except Exception as e:
+                print(f"TeeLogger failed to write to {self.log_path}: {e}", file=sys.__stderr__)
+            return
+        if any(marker in message for marker in URGENT_MARKERS):
+            self.flush()
         
     def flush(self):
-        """Flush both terminal and log file"""
-        self.terminal.flush()
-        self.log_file.flush()
+        """Block until everything queued so far is written"""
+        with self._stop_lock:
+            marker = None if self._stopped else _Marker()
+            if marker is not None:
+                self._queue.put(marker)
+        if marker is None:
+            # Writes are synchronous by now
+            self.terminal.flush()
+            return
+        marker.done.wait()
+    
+    def _stop(self):
+        """Write out pending messages and stop the background thread, keeping the log file open"""
+        with self._stop_lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            self._queue.put(_Marker(stop=True))
+        self._thread.join()
+        atexit.unregister(self._stop)
         
     def close(self):
-        """Close the log file"""
-        self.log_file.close()
+        """Write out pending messages, stop the background thread and close the log file
+        
+        Messages written afterwards still go to the terminal, synchronously.
+        """
+        if self._closed:
+            return
+        self._stop()
+        self._closed = True
+        os.close(self.log_fd)
+        self.log_fd = None
 
 
 @contextmanager
 def file_only_output(logger):
     """Temporarily redirect output to file only"""
+    # Let queued output reach the terminal before swapping it out
+    logger.flush()
     original_terminal = logger.terminal
     logger.terminal = open(os.devnull, 'w')  # Null device
     try:
         yield
     finally:
+        logger.flush()
         logger.terminal.close()
         logger.terminal = original_terminal
         
 
+class _TitleTable(dict):
+    """str.translate table keeping alphanumeric characters and mapping the rest to '_',
+    filled on first use of each code point"""
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        self[codepoint] = value = char if char.isalnum() else '_'
+        return value
+
+
+_TITLE_TABLE = _TitleTable((i, chr(i) if chr(i).isalnum() else '_') for i in range(1024))
+
+
 def _start_logging(title=None, descr=None, logs_dirpath="logs"):
     """Start logging all print outputs to a file with timestamp and optional title"""
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     
     if title:
         # Clean title to be filesystem-friendly
-        clean_title = ''.join(c if c.isalnum() else '_' for c in title).rstrip('_')
+        clean_title = title.translate(_TITLE_TABLE).rstrip('_')
         filename = f"{timestamp}_{clean_title}.log"
     else:
         filename = f"{timestamp}.log"
@@ -125,8 +433,41 @@ def start_logging2(title=None, descr=None, logs_dirpath="logs"):
 
 
 
+# Background listeners of loggers configured with use_queue=True, by logger name
+_QUEUE_LISTENERS = {}
+# Arguments and resulting handlers of the last setup_logger call, by logger name
+_LOGGER_CONFIGS = {}
+# Formatters are stateless, so one instance per format string is shared by all handlers
+_FORMATTER_CACHE = {}
+
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def _get_formatter(log_format):
+    """Return the shared Formatter for a format string"""
+    formatter = _FORMATTER_CACHE.get(log_format)
+    if formatter is None:
+        formatter = _FORMATTER_CACHE.setdefault(log_format, logging.Formatter(log_format))
+    return formatter
+
+
+def _stop_queue_listener(name):
+    """Stop the queue listener of a logger, writing out its pending records"""
+    listener = _QUEUE_LISTENERS.pop(name, None)
+    if listener is not None:
+        listener.stop()
+
+
+def _stop_all_queue_listeners():
+    for name in list(_QUEUE_LISTENERS):
+        _stop_queue_listener(name)
+
+
+atexit.register(_stop_all_queue_listeners)
+
+
 def setup_logger(name, log_file=None, log_level=logging.INFO, log_format=None, 
-                 log_dir="logs", timestamp=True, console=True):
+                 log_dir="logs", timestamp=True, console=True, use_queue=False):
     """
     Set up a logger with file and/or console output.
     
@@ -138,6 +479,12 @@ def setup_logger(name, log_file=None, log_level=logging.INFO, log_format=None,
         log_dir (str, optional): Directory for log files. Defaults to "logs".
         timestamp (bool, optional): Whether to add timestamp to log filename. Defaults to True.
         console (bool, optional): Whether to log to console. Defaults to True.
+        use_queue (bool, optional): Whether to hand records to a background thread
+            (QueueHandler/QueueListener) so the caller never waits on console or
+            file I/O. Defaults to False.
+    
+    Calling it again for the same name with the same arguments (e.g. re-running a
+    notebook cell) keeps the existing handlers and only updates the level.
     
     Returns:
         Logger: Configured logger object
@@ -145,18 +492,27 @@ def setup_logger(name, log_file=None, log_level=logging.INFO, log_format=None,
     # Create logger
     logger = logging.getLogger(name)
     logger.setLevel(log_level)
-    logger.handlers = []  # Clear any existing handlers
     
     # Define format
     if log_format is None:
-        log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    formatter = logging.Formatter(log_format)
+        log_format = DEFAULT_FORMAT
+    
+    # Nothing to do if the logger still has the handlers of an identical call
+    config = (log_file, log_format, str(log_dir), timestamp, console, use_queue)
+    previous = _LOGGER_CONFIGS.get(name)
+    if previous is not None and previous[0] == config and previous[1] == tuple(logger.handlers):
+        return logger
+    
+    _stop_queue_listener(name)
+    logger.handlers = []  # Clear any existing handlers
+    handlers = []
+    formatter = _get_formatter(log_format)
     
     # Add console handler if requested
     if console:
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # Add file handler if log_file is specified
     if log_file:
@@ -173,31 +529,62 @@ def setup_logger(name, log_file=None, log_level=logging.INFO, log_format=None,
         file_path = log_dir / log_file
         file_handler = logging.FileHandler(file_path)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-        
+        handlers.append(file_handler)
+    
+    if use_queue:
+        # Records are formatted and written by the listener thread
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _QUEUE_LISTENERS[name] = listener
+        logger.addHandler(QueueHandler(log_queue))
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
+    
+    _LOGGER_CONFIGS[name] = (config, tuple(logger.handlers))
+    
+    if log_file:
         logger.info(f"Logging to file: {file_path}")
     
     return logger
 
 
+# Loggers handed out by get_logger, by name
+_LOGGER_CACHE = {}
+_logger_cache_lock = threading.Lock()
+
+
+def _build_logger(name):
+    """Get a logger by name and give it a basic console handler if it has none"""
+    logger = logging.getLogger(name)
+    
+    # If logger doesn't have handlers, add a basic one
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(_get_formatter(DEFAULT_FORMAT))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+    
+    return logger
+
+
 def get_logger(name):
     """
     Get a logger by name. If it doesn't exist, creates a basic one.
     
+    The logger is set up on the first call for a name; later calls return it from a cache.
+    
     Args:
         name (str): Name of the logger
     
     Returns:
         Logger: Logger object
     """
-    logger = logging.getLogger(name)
-    
-    # If logger doesn't have handlers, add a basic one
-    if not logger.handlers:
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
-    
-    return logger
\ No newline at end of file
+    logger = _LOGGER_CACHE.get(name)
+    if logger is None:
+        with _logger_cache_lock:
+            logger = _LOGGER_CACHE.get(name)
+            if logger is None:
+                logger = _LOGGER_CACHE[name] = _build_logger(name)
+    return logger
@@ -1,5 +1,7 @@
 import os
+import time
 import logging
+import torch
 from torch import nn
 from pathlib import Path
 from datetime import datetime
@@ -26,19 +28,21 @@ class TensorLogger:
         self.writer.add_scalar(f'{mode}/{metric}', value, step)
         
     def log_report(self, report, step, mode='val'):
-        # Log metrics from the classification report
+        # Log metrics from the classification report, stamped with one shared wall time
+        walltime = time.time()
+        scalars = []
         for label, metrics in report.items():
             # Check if metrics is a dictionary
             if isinstance(metrics, dict):  # This will be True for class labels and averages
-                for metric_name, value in metrics.items():
-                    # Log class-specific metrics and averages except 'support'
-                    if metric_name != 'support':
-                        self.writer.add_scalar(f'{mode}_class_{label}/{metric_name}', value, step)
-            else:
+                # Log class-specific metrics and averages except 'support'
+                scalars.extend((f'{mode}_class_{label}/{metric_name}', value)
+                               for metric_name, value in metrics.items() if metric_name != 'support')
+            elif label == 'accuracy':
                 # This handles the overall 'accuracy', which is a single float value
-                # Log overall accuracy
-                if label == 'accuracy':
-                    self.writer.add_scalar(f'{mode}/{label}', metrics, step)
+                scalars.append((f'{mode}/{label}', metrics))
+        add_scalar = self.writer.add_scalar
+        for tag, value in scalars:
+            add_scalar(tag, value, step, walltime=walltime)
     
     def log_text(self, txt, step):
         # Log some text
@@ -50,19 +54,24 @@ class TensorLogger:
         if lr is None:
             lr = model.optimizers().param_groups[0]['lr']
 
-        # Iterate through named parameters to calculate and log metrics
+        # Collect the per-layer statistics on the device, without syncing per layer
+        names, grad_stds, param_stds = [], [], []
         for name, p in model.named_parameters():
             if p.ndim == 2 and p.grad is not None:
-                # Calculate the standard deviation of the gradients adjusted by the learning rate
-                grad_std = (lr * p.grad).std()
-                # Calculate the standard deviation of the parameter values
-                param_std = p.data.std()
-                # Calculate the Update Discrepancy (ud) metric and take the log10
-                metric = (grad_std / param_std).log10().item()
-                # Create a formatted name that corresponds to the naming convention in the TensorBoard layout
-                formatted_name = f"{model_prefix}{'_' if len(model_prefix) >0 else ''}z_ud_" + name.replace('.', '_')
-                # Log the metric using the formatted name
-                self.log_metric(metric, step, formatted_name)
+                names.append(name)
+                # Standard deviation of the gradients adjusted by the learning rate
+                grad_stds.append((lr * p.grad).std().float())
+                # Standard deviation of the parameter values
+                param_stds.append(p.data.std().float())
+        if not names:
+            return
+        
+        # Update Discrepancy (ud) metric for all layers, fetched with a single device-to-host transfer
+        metrics = torch.log10(torch.stack(grad_stds) / torch.stack(param_stds)).cpu().tolist()
+        prefix = f"{model_prefix}{'_' if len(model_prefix) >0 else ''}z_ud_"
+        for name, metric in zip(names, metrics):
+            # Create a formatted name that corresponds to the naming convention in the TensorBoard layout
+            self.log_metric(metric, step, prefix + name.replace('.', '_'))
                 
     def log_model_arch(self, model):
         # Log the model architecture at the start of training
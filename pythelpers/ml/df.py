@@ -1,29 +1,104 @@
+import re
+import warnings
 import pandas as pd
 import numpy as np
 
-def auto_convert_numeric_strings(df):
-    """Automatically detect and convert string columns that contain numbers"""
-    df_result = df.copy()
+# Numbers in plain decimal or scientific notation, with optional sign and surrounding
+# whitespace (both of which pd.to_numeric accepts)
+NUMERIC_RE = re.compile(r'\s*[-+]?\d+(\.\d+)?([eE][+-]?\d+)?\s*')
+# Columns where fewer than PREFILTER_MIN_MATCH of PREFILTER_SAMPLE sampled values
+# look numeric are kept as strings without attempting a full conversion
+PREFILTER_SAMPLE = 100
+PREFILTER_MIN_MATCH = 0.5
+
+def auto_convert_numeric_strings(df, threshold=0.9):
+    """Automatically detect and convert string columns that contain numbers
+    
+    A column is converted when at least `threshold` of its non-null values parse as numbers;
+    the values that don't parse become NaN.
+    """
+    converted_cols = {}
     
     # Get string columns
     string_columns = df.select_dtypes(include=['object']).columns
     
     for col in string_columns:
-        # Check if column contains numeric strings
-        # Sample a few values to test
-        sample = df[col].dropna().head(10)
-        try:
-            # Try converting sample to see if it works
-            pd.to_numeric(sample)
-            # If it works, convert the whole column
-            df_result[col] = pd.to_numeric(df_result[col], errors='coerce')
+        values = df[col].dropna()
+        if values.empty:
+            print(f"Keeping column {col} as string")
+            continue
+        # Cheap regex check on a small sample to skip obvious text columns; drawing
+        # positions with replacement costs O(PREFILTER_SAMPLE), not a full permutation
+        positions = np.random.default_rng(0).integers(0, len(values), size=PREFILTER_SAMPLE)
+        sample = values.iloc[positions]
+        if sample.astype(str).str.fullmatch(NUMERIC_RE).mean() < PREFILTER_MIN_MATCH:
+            print(f"Keeping column {col} as string")
+            continue
+        
+        # Convert the whole column once, unparseable values become NaN
+        converted = pd.to_numeric(df[col], errors='coerce')
+        non_null = len(values)
+        if converted.notna().sum() / non_null >= threshold:
+            converted_cols[col] = converted
             print(f"Converted column {col} to numeric")
-        except:
-            # Keep as string if conversion fails
+        else:
+            # Keep as string if too few values are numeric
             print(f"Keeping column {col} as string")
     
+    # Shallow copy: only the converted columns are new, the rest are shared with df
+    # (unlike df.assign, this also works for non-string column labels)
+    df_result = df.copy(deep=False)
+    for col, converted in converted_cols.items():
+        df_result[col] = converted
     return df_result
 
+def _non_constant_mask(values):
+    """Boolean mask of the columns of a 2-D float array whose values are not all equal (NaNs ignored)"""
+    with warnings.catch_warnings():
+        # All-NaN columns warn here and count as constant
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return np.nanmax(values, axis=0) > np.nanmin(values, axis=0)
+
+def _corr_matrix(values):
+    """Pearson correlation matrix of the columns of a 2-D float array with NaN entries replaced by 0"""
+    if np.isnan(values).any():
+        # Let pandas handle missing values pairwise
+        return pd.DataFrame(values).corr().fillna(0).values
+    return np.nan_to_num(np.corrcoef(values, rowvar=False), nan=0.0)
+
+def _numeric_block(df, cols):
+    """Float array of `cols`, missing or non-numeric columns are all NaN"""
+    return df.select_dtypes(include=[np.number]).reindex(columns=cols).to_numpy(dtype=np.float64)
+
+def _histogram_densities(values, bins=20):
+    """Per-column np.histogram(column, bins=bins, density=True)[0] over the finite values
+    of a 2-D array, as one (n_cols, bins) array computed with a single np.bincount.
+    Columns without finite values are all NaN"""
+    n_cols = values.shape[1]
+    finite = np.isfinite(values)
+    rows, cols = np.nonzero(finite)
+    flat = values[rows, cols]
+    counts = np.bincount(cols, minlength=n_cols)
+    masked = np.where(finite, values, np.nan)
+    with warnings.catch_warnings():
+        # All-NaN columns warn here, their ranges stay NaN
+        warnings.simplefilter('ignore', RuntimeWarning)
+        lo, hi = np.nanmin(masked, axis=0), np.nanmax(masked, axis=0)
+    same = lo == hi
+    lo[same] -= 0.5
+    hi[same] += 0.5
+    edges = np.linspace(lo, hi, bins + 1, axis=1)
+    # Bin indices as np.histogram computes them: scale, then correct against the actual
+    # edges so values on an edge land in the same bin (the last bin is closed)
+    idx = ((flat - lo[cols]) / (hi - lo)[cols] * bins).astype(np.intp)
+    idx[idx == bins] -= 1
+    idx[flat < edges[cols, idx]] -= 1
+    idx[(flat >= edges[cols, idx + 1]) & (idx != bins - 1)] += 1
+    # Offset each column's bin indices so every column gets its own block of bins
+    hist = np.bincount(idx + cols * bins, minlength=n_cols * bins).reshape(n_cols, bins)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return hist / np.diff(edges, axis=1) / counts[:, None]
+
 def statistic_similarity(df1, df2):
     # make sure all numeric
     df2 = auto_convert_numeric_strings(df2)
@@ -36,17 +111,23 @@ def statistic_similarity(df1, df2):
     
     # Column correlations with proper error handling
     try:
+        # One float block per frame, shared by the constant-column screen and the correlation
+        real_numeric = df2.select_dtypes(include=[np.number])
+        gen_numeric = df1.select_dtypes(include=[np.number])
+        real_values = real_numeric.to_numpy(dtype=np.float64)
+        gen_values = gen_numeric.to_numpy(dtype=np.float64)
+        
         # Drop constant columns which cause NaN in correlation
-        real_data_corr = df2.loc[:, df2.nunique() > 1]
-        generated_data_corr = df1.loc[:, df1.nunique() > 1]
+        real_keep = real_numeric.columns[_non_constant_mask(real_values)]
+        gen_keep = set(gen_numeric.columns[_non_constant_mask(gen_values)])
         
         # Make sure we use the same columns for both dataframes
-        common_cols = list(set(real_data_corr.columns) & set(generated_data_corr.columns))
+        common_cols = [col for col in real_keep if col in gen_keep]
         if len(common_cols) < 2:  # Need at least 2 columns for correlation
             corr_diff = np.nan
         else:
-            real_corr = real_data_corr[common_cols].corr().fillna(0).values
-            gen_corr = generated_data_corr[common_cols].corr().fillna(0).values
+            real_corr = _corr_matrix(real_values[:, real_numeric.columns.get_indexer(common_cols)])
+            gen_corr = _corr_matrix(gen_values[:, gen_numeric.columns.get_indexer(common_cols)])
             corr_diff = np.mean(np.abs(real_corr - gen_corr))
     except Exception as e:
         print(f"Error calculating correlation: {e}")
@@ -56,13 +137,15 @@ def statistic_similarity(df1, df2):
     dist_diff = 0
     continuous_cols = df2.select_dtypes(include=['float64', 'int64']).columns
     if len(continuous_cols) > 0:
-        for col in continuous_cols:
-            try:
-                real_hist = np.histogram(df2[col], bins=20, density=True)[0]
-                gen_hist = np.histogram(df1[col], bins=20, density=True)[0]
-                dist_diff += np.sum(np.abs(real_hist - gen_hist)) / len(real_hist)
-            except Exception as e:
-                print(f"Error calculating histogram for column {col}: {e}")
+        try:
+            real_hist = _histogram_densities(_numeric_block(df2, continuous_cols))
+            gen_hist = _histogram_densities(_numeric_block(df1, continuous_cols))
+            col_diff = np.abs(real_hist - gen_hist).sum(axis=1) / real_hist.shape[1]
+            for col in continuous_cols[np.isnan(col_diff)]:
+                print(f"Error calculating histogram for column {col}: no numeric values")
+            dist_diff = np.nansum(col_diff)
+        except Exception as e:
+            print(f"Error calculating histograms: {e}")
         dist_diff = dist_diff / len(continuous_cols)  # Average over all columns
     else:
         dist_diff = np.nan
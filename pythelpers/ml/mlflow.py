@@ -1,17 +1,110 @@
 from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, Future
 import torch
 from zenml.logger import get_logger # ZenML's logger
 import mlflow
 import mlflow.tracking # For MlflowClient
+from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from pathlib import Path
-import tempfile # For temporary file handling
+import tempfile # For in-progress downloads
 import re # For parsing epoch from filename
 import os # For file operations
+import atexit
 
 
 
 logger = get_logger(__name__) # Use ZenML's logger for the step
 
+# Artifact deletions are independent store requests and run concurrently on this many threads
+DELETE_WORKERS = 8
+# Background rotations started by rotate_checkpoints_async; pending ones finish before exit
+_ROTATION_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="checkpoint-rotation")
+atexit.register(_ROTATION_EXECUTOR.shutdown, wait=True)
+# Downloaded artifacts are kept here (as <run_id>/<artifact_path>) and reused by later loads
+_ARTIFACT_CACHE_DIR = Path(os.environ.get("PYTHELPERS_MLFLOW_CACHE", "~/.cache/pythelpers/mlflow")).expanduser()
+
+
+def _cached_download(
+    client: mlflow.tracking.MlflowClient,
+    run_id: str,
+    artifact_path: str,
+    file_size: Optional[int] = None
+) -> Path:
+    """
+    Downloads an artifact into the persistent cache unless it is already there, returns its local path.
+    `file_size` (from the artifact listing) makes a cached copy of a different size count as stale.
+    """
+    run_cache_dir = _ARTIFACT_CACHE_DIR / run_id
+    local_path = run_cache_dir / artifact_path
+    if local_path.is_file() and (file_size is None or local_path.stat().st_size == file_size):
+        logger.info(f"Using cached artifact '{local_path}'")
+        return local_path
+    run_cache_dir.mkdir(parents=True, exist_ok=True)
+    # Download beside the cache and move into place, so an interrupted download is never taken as cached
+    with tempfile.TemporaryDirectory(dir=run_cache_dir, prefix=".download-") as tmp_download_dir:
+        downloaded_path = client.download_artifacts(run_id=run_id, path=artifact_path, dst_path=tmp_download_dir)
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(downloaded_path, local_path)
+    return local_path
+
+
+
+# Expecting filenames like model_checkpoint_epoch_0042.pt or model_epoch_42_val_1.23.pt
+_EPOCH_RE = re.compile(r"epoch_(\d+)")
+
+
+def _parse_epoch_artifacts(artifacts):
+    """
+    Picks the files whose names carry an epoch number from an artifact listing, in one pass,
+    as dicts with "epoch" and "path" (relative to the run artifact root).
+    """
+    checkpoints = []
+    for art in artifacts:
+        if art.is_dir:
+            continue
+        match = _EPOCH_RE.search(art.path)
+        if match:
+            checkpoints.append({"epoch": int(match.group(1)), "path": art.path, "file_size": art.file_size})
+    return checkpoints
+
+
+def _scan_epoch_artifacts(client: mlflow.tracking.MlflowClient, run_id: str, artifact_subdir: str):
+    """Lists artifact_subdir and parses it with _parse_epoch_artifacts. Listing errors are raised."""
+    return _parse_epoch_artifacts(client.list_artifacts(run_id=run_id, path=artifact_subdir))
+
+
+def _list_many(client: mlflow.tracking.MlflowClient, run_id: str, subdirs) -> Dict[str, Optional[list]]:
+    """
+    Lists several artifact subdirectories concurrently. Returns {subdir: listing}, with None
+    for subdirectories whose listing failed (the rotation helpers then list them again themselves).
+    """
+    def list_one(subdir):
+        try:
+            return client.list_artifacts(run_id=run_id, path=subdir)
+        except Exception as e:
+            logger.warning(f"Could not list artifacts in '{subdir}' for run_id '{run_id}': {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(DELETE_WORKERS, max(len(subdirs), 1))) as executor:
+        return dict(zip(subdirs, executor.map(list_one, subdirs)))
+
+
+def _torch_load(checkpoint_file: Path, device: str) -> Dict[str, Any]:
+    """
+    Loads a checkpoint memory-mapped instead of reading the whole file into RAM first;
+    tensor data is paged in from the file as it is copied to its destination.
+    Requires checkpoints written with the default zipfile format of torch.save.
+    """
+    return torch.load(checkpoint_file, map_location=torch.device(device), mmap=True, weights_only=True)
+
+
+# Checkpoint entries that are only needed to resume training
+_TRAINING_STATE_KEYS = ("optimizer_state_dict", "scheduler_state_dict")
+
+
+def _drop_training_state(checkpoint_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Checkpoint without optimizer/scheduler state; with mmap loading their tensors are then never read"""
+    return {key: value for key, value in checkpoint_data.items() if key not in _TRAINING_STATE_KEYS}
 
 
 # --- Helper Function to Load Full Resumable Checkpoint from MLflow ---
@@ -21,64 +114,61 @@ def load_latest_checkpoint2(
     model: torch.nn.Module,
     optimizer: Optional[torch.optim.Optimizer] = None,
     scheduler: Optional[torch.optim.lr_scheduler._LRScheduler] = None, # type: ignore
-    device: str = "cpu"
+    device: str = "cpu",
+    load_weights_only: bool = False
 ) -> Optional[Dict[str, Any]]:
     """
     Loads the latest full resumable checkpoint from a subdirectory in MLflow artifacts
     for the current run.
     Sorts checkpoints by epoch number parsed from filenames.
+    The checkpoint is memory-mapped and copied straight into the model's parameters.
+    A model built under `with torch.device("meta"):` has no storage yet; its parameters
+    are then taken over from the checkpoint (`assign=True`) and moved to `device`, so
+    weights are never allocated twice. Build the optimizer after loading in that case.
+    With load_weights_only=True only the model weights are restored, optimizer and scheduler
+    are left untouched and their state is left out of the returned dict.
     """
     client = mlflow.tracking.MlflowClient()
     try:
-        artifacts = client.list_artifacts(run_id=run_id, path=artifact_subdir)
+        checkpoints = _scan_epoch_artifacts(client, run_id, artifact_subdir)
     except Exception as e:
         logger.warning(f"Could not list artifacts in '{artifact_subdir}' for run_id '{run_id}': {e}. Assuming no checkpoint.")
         return None
 
-    checkpoints = []
-    for art in artifacts:
-        if art.is_dir:
-            continue
-        # Expecting filenames like model_checkpoint_epoch_0042.pt or model_epoch_42_val_1.23.pt
-        match = re.search(r"epoch_(\d+)", art.path)
-        if match:
-            epoch = int(match.group(1))
-            checkpoints.append({"epoch": epoch, "path": art.path, "artifact_full_path": art.path})
-
     if not checkpoints:
         logger.info(f"No checkpoints found in MLflow artifacts path '{artifact_subdir}'.")
         return None
 
-    # Sort by epoch descending to get the latest
-    checkpoints.sort(key=lambda x: x["epoch"], reverse=True)
-    latest_checkpoint_info = checkpoints[0]
+    # Highest epoch is the latest
+    latest_checkpoint_info = max(checkpoints, key=lambda x: x["epoch"])
     
     logger.info(f"Found latest checkpoint: {latest_checkpoint_info['path']} (epoch {latest_checkpoint_info['epoch']})")
 
     try:
-        with tempfile.TemporaryDirectory() as tmp_download_dir:
-            downloaded_artifact_path_str = client.download_artifacts(
-                run_id=run_id,
-                path=latest_checkpoint_info["artifact_full_path"], # Path relative to artifact root
-                dst_path=tmp_download_dir
-            )
-            actual_checkpoint_file = Path(downloaded_artifact_path_str)
+        actual_checkpoint_file = _cached_download(client, run_id, latest_checkpoint_info["path"], latest_checkpoint_info["file_size"])
+        
+        if actual_checkpoint_file.exists() and actual_checkpoint_file.is_file():
+            logger.info(f"Loading checkpoint from '{actual_checkpoint_file}'...")
+            checkpoint_data = _torch_load(actual_checkpoint_file, "cpu")
+
+            # Assigning would detach parameters already registered with an optimizer,
+            # so it is only used when the model has no storage to copy into
+            on_meta = any(p.is_meta for p in model.parameters())
+            model.load_state_dict(checkpoint_data['model_state_dict'], assign=on_meta)
+            if on_meta:
+                model.to(device)
+            if load_weights_only:
+                checkpoint_data = _drop_training_state(checkpoint_data)
+            if optimizer and 'optimizer_state_dict' in checkpoint_data:
+                optimizer.load_state_dict(checkpoint_data['optimizer_state_dict'])
+            if scheduler and 'scheduler_state_dict' in checkpoint_data:
+                scheduler.load_state_dict(checkpoint_data['scheduler_state_dict'])
             
-            if actual_checkpoint_file.exists() and actual_checkpoint_file.is_file():
-                logger.info(f"Loading checkpoint from '{actual_checkpoint_file}'...")
-                checkpoint_data = torch.load(actual_checkpoint_file, map_location=torch.device(device))
-
-                model.load_state_dict(checkpoint_data['model_state_dict'])
-                if optimizer and 'optimizer_state_dict' in checkpoint_data:
-                    optimizer.load_state_dict(checkpoint_data['optimizer_state_dict'])
-                if scheduler and 'scheduler_state_dict' in checkpoint_data:
-                    scheduler.load_state_dict(checkpoint_data['scheduler_state_dict'])
-                
-                logger.info(f"Resuming training. Loaded state from epoch: {checkpoint_data.get('epoch', -1)}")
-                return checkpoint_data # Return the whole dict
-            else:
-                logger.error(f"Downloaded artifact path '{actual_checkpoint_file}' is not a valid file.")
-                return None
+            logger.info(f"Resuming training. Loaded state from epoch: {checkpoint_data.get('epoch', -1)}")
+            return checkpoint_data # Return the whole dict
+        else:
+            logger.error(f"Downloaded artifact path '{actual_checkpoint_file}' is not a valid file.")
+            return None
     except Exception as e:
         logger.error(f"Error loading checkpoint {latest_checkpoint_info['path']}: {e}")
         return None
@@ -96,49 +186,32 @@ def load_latest_checkpoint(
     """
     client = mlflow.tracking.MlflowClient()
     try:
-        artifacts = client.list_artifacts(run_id=run_id, path=artifact_subdir)
+        checkpoints = _scan_epoch_artifacts(client, run_id, artifact_subdir)
     except Exception as e:
         logger.warning(f"Could not list artifacts in '{artifact_subdir}' for run_id '{run_id}': {e}. Assuming no checkpoint.")
         return None
 
-    checkpoints = []
-    for art in artifacts:
-        if art.is_dir:
-            continue
-        # Expecting filenames like model_checkpoint_epoch_0042.pt or model_epoch_42_val_1.23.pt
-        match = re.search(r"epoch_(\d+)", art.path)
-        if match:
-            epoch = int(match.group(1))
-            checkpoints.append({"epoch": epoch, "path": art.path, "artifact_full_path": art.path})
-
     if not checkpoints:
         logger.info(f"No checkpoints found in MLflow artifacts path '{artifact_subdir}'.")
         return None
 
-    # Sort by epoch descending to get the latest
-    checkpoints.sort(key=lambda x: x["epoch"], reverse=True)
-    latest_checkpoint_info = checkpoints[0]
+    # Highest epoch is the latest
+    latest_checkpoint_info = max(checkpoints, key=lambda x: x["epoch"])
     
     logger.info(f"Found latest checkpoint: {latest_checkpoint_info['path']} (epoch {latest_checkpoint_info['epoch']})")
 
     try:
-        with tempfile.TemporaryDirectory() as tmp_download_dir:
-            downloaded_artifact_path_str = client.download_artifacts(
-                run_id=run_id,
-                path=latest_checkpoint_info["artifact_full_path"], # Path relative to artifact root
-                dst_path=tmp_download_dir
-            )
-            actual_checkpoint_file = Path(downloaded_artifact_path_str)
-            
-            if actual_checkpoint_file.exists() and actual_checkpoint_file.is_file():
-                logger.info(f"Loading checkpoint from '{actual_checkpoint_file}'...")
-                checkpoint_data = torch.load(actual_checkpoint_file, map_location=torch.device(device))
+        actual_checkpoint_file = _cached_download(client, run_id, latest_checkpoint_info["path"], latest_checkpoint_info["file_size"])
         
-                logger.info(f"Resuming training. Loaded state from epoch: {checkpoint_data.get('epoch', -1)}")
-                return checkpoint_data # Return the whole dict
-            else:
-                logger.error(f"Downloaded artifact path '{actual_checkpoint_file}' is not a valid file.")
-                return None
+        if actual_checkpoint_file.exists() and actual_checkpoint_file.is_file():
+            logger.info(f"Loading checkpoint from '{actual_checkpoint_file}'...")
+            checkpoint_data = _torch_load(actual_checkpoint_file, device)
+
+            logger.info(f"Resuming training. Loaded state from epoch: {checkpoint_data.get('epoch', -1)}")
+            return checkpoint_data # Return the whole dict
+        else:
+            logger.error(f"Downloaded artifact path '{actual_checkpoint_file}' is not a valid file.")
+            return None
     except Exception as e:
         logger.error(f"Error loading checkpoint {latest_checkpoint_info['path']}: {e}")
         return None
@@ -147,24 +220,21 @@ def load_latest_checkpoint(
 def rotate_checkpoints(
     run_id: str,
     artifact_subdir: str,
-    max_checkpoints: int
+    max_checkpoints: int,
+    artifacts: Optional[list] = None
 ):
-    """Keeps only the 'max_checkpoints' most recent checkpoints in the artifact_subdir."""
+    """
+    Keeps only the 'max_checkpoints' most recent checkpoints in the artifact_subdir.
+    `artifacts` is an already fetched listing of artifact_subdir, if any (see rotate_all).
+    """
     client = mlflow.tracking.MlflowClient()
     try:
-        artifacts = client.list_artifacts(run_id=run_id, path=artifact_subdir)
+        if artifacts is None:
+            artifacts = client.list_artifacts(run_id=run_id, path=artifact_subdir)
     except Exception as e:
         logger.warning(f"Could not list artifacts for rotation in '{artifact_subdir}': {e}")
         return
-
-    checkpoints = []
-    for art in artifacts:
-        if art.is_dir:
-            continue
-        match = re.search(r"epoch_(\d+)", art.path) # Assumes epoch is in filename
-        if match:
-            epoch = int(match.group(1))
-            checkpoints.append({"epoch": epoch, "path": art.path}) # art.path is relative to run artifact root
+    checkpoints = _parse_epoch_artifacts(artifacts)
 
     if len(checkpoints) <= max_checkpoints:
         return
@@ -175,29 +245,58 @@ def rotate_checkpoints(
     num_to_delete = len(checkpoints) - max_checkpoints
     checkpoints_to_delete = checkpoints[:num_to_delete]
 
-    for ckpt_info in checkpoints_to_delete:
+    try:
+        artifact_repo = _get_artifact_repo(client, run_id)
+    except Exception as e:
+        logger.warning(f"Could not resolve the artifact store for rotation in '{artifact_subdir}': {e}")
+        return
+
+    def delete(ckpt_info):
         try:
             logger.info(f"Deleting old checkpoint: {ckpt_info['path']}")
-            delete_artifact_local(run_id, ckpt_info['path'])
+            delete_artifact_local(run_id, ckpt_info['path'], artifact_repo)
         except Exception as e:
             logger.error(f"Failed to delete old checkpoint {ckpt_info['path']}: {e}")
 
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+        list(executor.map(delete, checkpoints_to_delete))
+
+def _rotate_checkpoints_safe(run_id: str, artifact_subdir: str, max_checkpoints: int):
+    try:
+        rotate_checkpoints(run_id, artifact_subdir, max_checkpoints)
+    except Exception as e:
+        logger.error(f"Background checkpoint rotation in '{artifact_subdir}' failed: {e}")
+
+def rotate_checkpoints_async(
+    run_id: str,
+    artifact_subdir: str,
+    max_checkpoints: int
+) -> Future:
+    """
+    Same as rotate_checkpoints, but runs in a background thread so the training loop does not
+    wait for the deletions. Errors are logged, not raised. Returns the Future of the rotation.
+    """
+    return _ROTATION_EXECUTOR.submit(_rotate_checkpoints_safe, run_id, artifact_subdir, max_checkpoints)
+
 def rotate_bestmodels(
     run_id: str,
     metric: str = "loss",
     artifact_subdir: str = "",
     max: int = 5,
-    maximize: bool = False
+    maximize: bool = False,
+    artifacts: Optional[list] = None
 ):
     """
     Keeps only the 'max' best checkpoints in the artifact_subdir, 
     based on the value of the specified metric in the checkpoint filename.
     By default, keeps the checkpoints with the lowest metric (assumed to be loss).
     Set maximize=True to keep the highest values (e.g., for accuracy).
+    `artifacts` is an already fetched listing of artifact_subdir, if any (see rotate_all).
     """
     client = mlflow.tracking.MlflowClient()
     try:
-        artifacts = client.list_artifacts(run_id=run_id, path=artifact_subdir)
+        if artifacts is None:
+            artifacts = client.list_artifacts(run_id=run_id, path=artifact_subdir)
     except Exception as e:
         logger.warning(f"Could not list artifacts for rotation in '{artifact_subdir}': {e}")
         return
@@ -225,25 +324,60 @@ def rotate_bestmodels(
 
     # Keep the best 'max', delete the rest
     to_delete = checkpoints[max:]
-    for ckpt_info in to_delete:
+    try:
+        artifact_repo = _get_artifact_repo(client, run_id)
+    except Exception as e:
+        logger.warning(f"Could not resolve the artifact store for rotation in '{artifact_subdir}': {e}")
+        return
+
+    def delete(ckpt_info):
         try:
             logger.info(f"Deleting old best model (metric={metric}, value={ckpt_info['metric']}): {ckpt_info['path']}")
-            delete_artifact_local(run_id, ckpt_info['path'])
+            delete_artifact_local(run_id, ckpt_info['path'], artifact_repo)
         except Exception as e:
             logger.error(f"Failed to delete old best model {ckpt_info['path']}: {e}")
 
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+        list(executor.map(delete, to_delete))
+
+def rotate_all(
+    run_id: str,
+    checkpoint_subdir: str,
+    max_checkpoints: int,
+    bestmodel_subdir: str = "",
+    metric: str = "loss",
+    max_bestmodels: int = 5,
+    maximize: bool = False
+):
+    """
+    Runs rotate_checkpoints and rotate_bestmodels together, listing both subdirectories
+    concurrently up front instead of one after the other.
+    """
+    if checkpoint_subdir == bestmodel_subdir:
+        # The second rotation has to see what the first one deleted
+        listings = {}
+    else:
+        client = mlflow.tracking.MlflowClient()
+        listings = _list_many(client, run_id, [checkpoint_subdir, bestmodel_subdir])
+    rotate_checkpoints(run_id, checkpoint_subdir, max_checkpoints, artifacts=listings.get(checkpoint_subdir))
+    rotate_bestmodels(run_id, metric=metric, artifact_subdir=bestmodel_subdir, max=max_bestmodels,
+                      maximize=maximize, artifacts=listings.get(bestmodel_subdir))
+
 def load_best_model(
     run_id: str,
     artifact_subdir: str = "",
     metric: str = "loss",
     maximize: bool = False,
-    device: str = "cpu"
+    device: str = "cpu",
+    load_weights_only: bool = True
 ) -> Optional[Dict[str, Any]]:
     """
     Loads the best checkpoint from a subdirectory in MLflow artifacts for the given run,
     based on the value of the specified metric in the checkpoint filename.
     By default, returns the checkpoint with the lowest metric (e.g., for loss).
     Set maximize=True to load the highest value (e.g., for accuracy).
+    By default optimizer and scheduler state are left out of the returned checkpoint;
+    pass load_weights_only=False to get them too.
     """
     client = mlflow.tracking.MlflowClient()
     try:
@@ -264,7 +398,7 @@ def load_best_model(
                 metric_val = float(match.group(1))
             except ValueError:
                 continue
-            checkpoints.append({"metric": metric_val, "path": art.path})
+            checkpoints.append({"metric": metric_val, "path": art.path, "file_size": art.file_size})
 
     if not checkpoints:
         logger.info(f"No checkpoints with metric '{metric}' found in MLflow artifacts path '{artifact_subdir}'.")
@@ -276,35 +410,42 @@ def load_best_model(
 
     logger.info(f"Found best checkpoint: {best_ckpt['path']} ({metric}={best_ckpt['metric']})")
     try:
-        with tempfile.TemporaryDirectory() as tmp_download_dir:
-            downloaded_path = client.download_artifacts(
-                run_id=run_id,
-                path=best_ckpt['path'],
-                dst_path=tmp_download_dir
-            )
-            actual_ckpt_file = Path(downloaded_path)
-            if actual_ckpt_file.exists() and actual_ckpt_file.is_file():
-                logger.info(f"Loading checkpoint from '{actual_ckpt_file}'...")
-                checkpoint_data = torch.load(actual_ckpt_file, map_location=torch.device(device))
-                logger.info(f"Loaded checkpoint with {metric}: {best_ckpt['metric']}")
-                return checkpoint_data
-            else:
-                logger.error(f"Downloaded artifact path '{actual_ckpt_file}' is not a valid file.")
-                return None
+        actual_ckpt_file = _cached_download(client, run_id, best_ckpt['path'], best_ckpt['file_size'])
+        if actual_ckpt_file.exists() and actual_ckpt_file.is_file():
+            logger.info(f"Loading checkpoint from '{actual_ckpt_file}'...")
+            checkpoint_data = _torch_load(actual_ckpt_file, device)
+            if load_weights_only:
+                checkpoint_data = _drop_training_state(checkpoint_data)
+            logger.info(f"Loaded checkpoint with {metric}: {best_ckpt['metric']}")
+            return checkpoint_data
+        else:
+            logger.error(f"Downloaded artifact path '{actual_ckpt_file}' is not a valid file.")
+            return None
     except Exception as e:
         logger.error(f"Error loading best checkpoint {best_ckpt['path']}: {e}")
         return None
 
 
 
-def delete_artifact_local(run_id, artifact_path):
-    client = mlflow.tracking.MlflowClient()
-    local_path = client.download_artifacts(run_id, artifact_path)
-    if os.path.isfile(local_path):
-        os.remove(local_path)
-        logger.info(f"Deleted local artifact: {local_path}")
-    else:
-        logger.warning(f"File not found for deletion: {local_path}")
+def _get_artifact_repo(client: mlflow.tracking.MlflowClient, run_id: str):
+    """Artifact repository of a run, for operations MlflowClient does not expose (deletion)"""
+    return get_artifact_repository(client.get_run(run_id).info.artifact_uri)
+
+
+def delete_artifact_local(run_id, artifact_path, artifact_repo=None):
+    """
+    Deletes an artifact from the run's artifact store, without downloading it, and drops its cached copy.
+    Pass `artifact_repo` (see `_get_artifact_repo`) to skip looking up the run when deleting many artifacts.
+    """
+    if artifact_repo is None:
+        artifact_repo = _get_artifact_repo(mlflow.tracking.MlflowClient(), run_id)
+    artifact_repo.delete_artifacts(artifact_path)
+    logger.info(f"Deleted artifact: {artifact_path}")
+    try:
+        # No existence check first: concurrent rotations may remove the same cached copy
+        (_ARTIFACT_CACHE_DIR / run_id / artifact_path).unlink()
+    except FileNotFoundError:
+        pass
 
 # --- Helper function for checkpoint rotation ---
 def remove_all_from_artifact_dir(
@@ -314,10 +455,17 @@ def remove_all_from_artifact_dir(
     try:
         client = mlflow.tracking.MlflowClient()
         artifacts_in_subdir = client.list_artifacts(run_id=run_id, path=manual_bestmodel_subdir)
-        for old_artifact in artifacts_in_subdir:
-            if not old_artifact.is_dir: # Ensure it's a file
-                logger.info(f"Deleting previous best model artifact from MLflow: {old_artifact.path}")
-                client.delete_artifact(run_id=run_id, artifact_path=old_artifact.path)
+        old_paths = [old_artifact.path for old_artifact in artifacts_in_subdir if not old_artifact.is_dir] # Ensure it's a file
+        if not old_paths:
+            return
+        artifact_repo = _get_artifact_repo(client, run_id)
+
+        def delete(path):
+            logger.info(f"Deleting previous best model artifact from MLflow: {path}")
+            delete_artifact_local(run_id, path, artifact_repo)
+
+        with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+            list(executor.map(delete, old_paths))
     except Exception as e:
         # Log a warning if listing/deleting fails, but proceed to save the new one.
         # This could happen if the subdir doesn't exist yet (first best model).
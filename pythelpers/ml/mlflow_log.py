@@ -1,13 +1,21 @@
+import time
 import mlflow
+from mlflow.entities import Metric
 from pythelpers.ml.model_training_analyze import comp_layer_ur
 
+# Maximum number of metrics MLflow accepts in one log_batch request
+LOG_BATCH_MAX_METRICS = 1000
+
 def log_ur(model, step, model_prefix="", lr=None):
     client = mlflow.tracking.MlflowClient()
+    run_id = mlflow.active_run().info.run_id
 
     metric_listofdict = comp_layer_ur(model, lr=lr)
-    # Iterate through named parameters to calculate and log metrics
-    for metric in metric_listofdict:
-        # Create a formatted name that corresponds to the naming convention in the TensorBoard layout
-        formatted_name = f"{model_prefix}{'_' if len(model_prefix) >0 else ''}ur_" + metric['name']
-        # Log the metric using the formatted name
-        client.log_metric(run_id=mlflow.active_run().info.run_id, key=formatted_name, value=metric['metric'], step=step)
+    # Create formatted names that correspond to the naming convention in the TensorBoard layout
+    prefix = f"{model_prefix}{'_' if len(model_prefix) >0 else ''}ur_"
+    timestamp = int(time.time() * 1000)
+    metrics = [Metric(key=prefix + metric['name'], value=metric['metric'], timestamp=timestamp, step=step)
+               for metric in metric_listofdict]
+    # Log all layers with as few requests as possible instead of one request per layer
+    for start in range(0, len(metrics), LOG_BATCH_MAX_METRICS):
+        client.log_batch(run_id=run_id, metrics=metrics[start:start + LOG_BATCH_MAX_METRICS])
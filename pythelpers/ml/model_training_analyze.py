@@ -1,19 +1,29 @@
+import torch
+
+
 def comp_layer_ur(model, lr=None):
     # compute layer update grad relative to the parameter std
     if lr is None:
         lr = model.optimizers().param_groups[0]['lr']
 
-    metric_listofdict = []
-    # Iterate through named parameters to calculate and log metrics
-    for name, p in model.named_parameters():
-        if p.ndim == 2 and p.grad is not None:
-            # Calculate the standard deviation of the gradients adjusted by the learning rate
-            grad_std = (lr * p.grad).std()
-            # Calculate the standard deviation of the parameter values
-            param_std = p.data.std()
-            # Calculate the Update Discrepancy (ud) metric and take the log10
-            metric = (grad_std / param_std).log10().item()
-            metric_listofdict.append({'name': name.replace('.', '_'), 'metric': metric})
-    
-    return metric_listofdict
-            
\ No newline at end of file
+    # The 2-D parameters are looked up once per model and cached on it
+    # (delete model._ur_params after replacing the model's parameters)
+    params_2d = getattr(model, '_ur_params', None)
+    if params_2d is None:
+        params_2d = [(name, p) for name, p in model.named_parameters() if p.ndim == 2]
+        model._ur_params = params_2d
+
+    names, grad_stds, param_stds = [], [], []
+    for name, p in params_2d:
+        if p.grad is not None:
+            names.append(name.replace('.', '_'))
+            # Standard deviation of the gradients adjusted by the learning rate
+            grad_stds.append((lr * p.grad.detach()).float().std())
+            # Standard deviation of the parameter values
+            param_stds.append(p.data.float().std())
+    if not names:
+        return []
+
+    # Update Discrepancy (ud) metric in log10 for all layers, with a single device-to-host sync
+    metrics = torch.log10(torch.stack(grad_stds) / torch.stack(param_stds)).cpu().tolist()
+    return [{'name': name, 'metric': metric} for name, metric in zip(names, metrics)]
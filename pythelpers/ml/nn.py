@@ -22,13 +22,13 @@ class StepLRScheduler:
     def step(self, epoch):
         """Update learning rate based on epoch.
         
+        The rate depends only on `epoch`, so epochs may be skipped or revisited.
+        
         Args:
             epoch (int): Current training epoch
             
         Returns:
             float: Updated learning rate
         """
-        if epoch > 0 and epoch % self.step_size == 0:
-            self.current_lr = max(self.current_lr * self.gamma, self.min_lr)
-        
+        self.current_lr = max(self.initial_lr * self.gamma ** (epoch // self.step_size), self.min_lr)
         return self.current_lr
\ No newline at end of file
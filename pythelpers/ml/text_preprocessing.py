@@ -1,5 +1,6 @@
 import re
 import string
+import functools
 import contractions
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
@@ -9,36 +10,95 @@ from nltk.tokenize import word_tokenize
 stop_words_engl = set(stopwords.words('english'))
 # Initialize lemmatizer for text cleaning
 lemmatizer = WordNetLemmatizer()
+# spaCy model used by lemmatize_batch
+SPACY_MODEL = 'en_core_web_sm'
+
+# Patterns and tables used by the cleaning functions, compiled once at import
+# Links and non-ASCII characters in one pass; removing them together gives the same result as in sequence
+_RE_LINK_OR_NON_ASCII = re.compile(r"(?:\@|https?\://)\S+|[^\x00-\x7f]")
+_NEWLINE_TABLE = str.maketrans('\r\n', '  ')
+_RE_MULTI_SPACE = re.compile(r"\s\s+")
+_RE_DIGITS = re.compile(r'\d+')
+_RE_ELONG = re.compile(r'\b(\w+)((\w)\3{2,})(\w*)\b')
+_RE_REP_PUNCT = re.compile(r'[\?\.\!]+(?=[\?\.\!])')
+_RE_URL_SHORT = re.compile(r'(?:http[s]?://)?(?:www\.)?(?:bit\.ly|goo\.gl|t\.co|tinyurl\.com|tr\.im|is\.gd|cli\.gs|u\.nu|url\.ie|tiny\.cc|alturl\.com|ow\.ly|bit\.do|adoro\.to)\S+')
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+_DIGITS_TABLE = str.maketrans('', '', string.digits)
+# Stop words as whole whitespace-separated tokens, for removal from a whole Series at once
+_RE_STOP_WORDS = re.compile(r'(?<!\S)(?:' + '|'.join(map(re.escape, sorted(stop_words_engl))) + r')(?!\S)')
+_RE_WHITESPACE = re.compile(r'\s+')
 
 #Text  Cleaning
 def strip_all_entities(body):
-    body = re.sub(r'\r|\n', ' ', body.lower())  # Replace newline and carriage return with space, and convert to lowercase
-    body = re.sub(r"(?:\@|https?\://)\S+", "", body)  # Remove links
-    body = re.sub(r'[^\x00-\x7f]', '', body)  # Remove non-ASCII characters
-    banned_list = string.punctuation
-    table = str.maketrans('', '', banned_list)
-    body = body.translate(table)
-    body = ' '.join(word for word in body.split() if word not in stop_words_engl)
+    body = body.lower().translate(_NEWLINE_TABLE)  # Replace newline and carriage return with space, and convert to lowercase
+    body = _RE_LINK_OR_NON_ASCII.sub('', body)  # Remove links and non-ASCII characters
+    body = body.translate(_PUNCT_TABLE)
+    # A set lookup per token; join on a list avoids join materializing a generator first
+    body = ' '.join([word for word in body.split() if word not in stop_words_engl])
     return body
 
+# Full cleaning in one pass
+def clean(body, *, lemmatize=False, min_len=2):
+    """
+    Same result as strip_all_entities, filter_chars, remove_mult_spaces, remove_numbers,
+    lemmatize (only if `lemmatize`) and remove_short_words(min_len=min_len) applied in that
+    order, but with a single split/join. Lemmatization is done per whitespace-separated word.
+    """
+    body = _RE_LINK_OR_NON_ASCII.sub('', body.lower())  # Remove links and non-ASCII characters
+    # '$' and '&' are punctuation, so filter_chars has nothing left to drop
+    words = (word.translate(_DIGITS_TABLE) for word in body.translate(_PUNCT_TABLE).split()
+             if word not in stop_words_engl)
+    if lemmatize:
+        words = (_lemma(word) for word in words if word)
+    min_len = max(min_len, 1)
+    return ' '.join([word for word in words if len(word) >= min_len])
+
+# Vectorized strip_all_entities
+def clean_series(texts):
+    """
+    Same result as texts.apply(strip_all_entities) for a pandas Series of strings (missing
+    values stay missing), with every step run by pandas' string methods over the whole Series.
+    """
+    texts = texts.str.lower()
+    texts = texts.str.replace(_RE_LINK_OR_NON_ASCII, '', regex=True)  # Remove links and non-ASCII characters
+    texts = texts.str.translate(_PUNCT_TABLE)
+    texts = texts.str.replace(_RE_STOP_WORDS, '', regex=True)
+    return texts.str.replace(_RE_WHITESPACE, ' ', regex=True).str.strip()
+
 # Filter special characters such as & and $ present in some words
 def filter_chars(body):
-    return ' '.join('' if ('$' in word) or ('&' in word) else word for word in body.split())
+    return ' '.join(['' if ('$' in word) or ('&' in word) else word for word in body.split()])
 
 # Remove multiple spaces
 def remove_mult_spaces(body):
-    return re.sub(r"\s\s+", " ", body)
+    return _RE_MULTI_SPACE.sub(" ", body)
 # Expand contractions
 def expand_contractions(body):
     return contractions.fix(body)
 # Remove numbers
 def remove_numbers(body):
-    return re.sub(r'\d+', '', body)
+    return _RE_DIGITS.sub('', body)
+# Lemmas of single words, cached since word frequencies are heavily skewed
+@functools.lru_cache(maxsize=200_000)
+def _lemma(word):
+    return lemmatizer.lemmatize(word)
 # Lemmatize words
 def lemmatize(body):
-    words = word_tokenize(body)
-    lemmatized_words = [lemmatizer.lemmatize(word) for word in words]
-    return ' '.join(lemmatized_words)
+    return ' '.join([_lemma(word) for word in word_tokenize(body)])
+@functools.lru_cache(maxsize=None)
+def _spacy_pipeline(model):
+    import spacy  # Optional dependency, only needed for lemmatize_batch
+    return spacy.load(model, disable=['parser', 'ner'])
+# Lemmatize many texts at once with spaCy
+def lemmatize_batch(texts, batch_size=1024, n_process=-1):
+    """
+    Lemmatizes an iterable of texts with spaCy's nlp.pipe, in batches and on n_process
+    worker processes (-1 uses all CPUs). Returns a list of strings.
+    Requires spaCy and the SPACY_MODEL package; spaCy's lemmas can differ from WordNet's.
+    """
+    nlp = _spacy_pipeline(SPACY_MODEL)
+    return [' '.join([token.lemma_ for token in doc])
+            for doc in nlp.pipe(texts, batch_size=batch_size, n_process=n_process)]
 # Remove short words
 def remove_short_words(body, min_len=2):
     words = body.split()
@@ -46,16 +106,15 @@ def remove_short_words(body, min_len=2):
     return ' '.join(long_words)
 # Replace elongated words with their base form
 def replace_elongated_words(body):
-    regex_pattern = r'\b(\w+)((\w)\3{2,})(\w*)\b'
-    return re.sub(regex_pattern, r'\1\3\4', body)
+    return _RE_ELONG.sub(r'\1\3\4', body)
 # Remove repeated punctuation
 def remove_repeated_punctuation(body):
-    return re.sub(r'[\?\.\!]+(?=[\?\.\!])', '', body)
+    return _RE_REP_PUNCT.sub('', body)
 # Remove extra whitespace
 def remove_extra_whitespace(body):
     return ' '.join(body.split())
 def remove_url_shorteners(body):
-    return re.sub(r'(?:http[s]?://)?(?:www\.)?(?:bit\.ly|goo\.gl|t\.co|tinyurl\.com|tr\.im|is\.gd|cli\.gs|u\.nu|url\.ie|tiny\.cc|alturl\.com|ow\.ly|bit\.do|adoro\.to)\S+', '', body)
+    return _RE_URL_SHORT.sub('', body)
 # Remove short  tickets
 def remove_short_tickets(ticket, min_words=0):    # We do not need this , real data world is not forgiving
     words = ticket.split()
@@ -1,11 +1,34 @@
 import dill
+import pickle
+import joblib
+import numpy as np
+from sklearn.pipeline import Pipeline
 from sklearn.feature_extraction.text import TfidfVectorizer as SklearnTfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+
+# Module-level (not a lambda) so the fitted sklearn vectorizer stays picklable
+def _default_split_tokenizer(text):
+    return text.split()
 
 class TfidfVectorizer:
-    def __init__(self, max_df=1.0, min_df=1, ngram_range=(1, 3), tokenizer=lambda x: x.split()):
+    def __init__(self, max_df=1.0, min_df=1, ngram_range=(1, 3), tokenizer=_default_split_tokenizer,
+                 dtype=np.float32, use_hashing=False, n_features=2**20, sublinear_tf=False):
+        """
+        Args:
+            dtype: Dtype of the TF-IDF matrix; float32 halves its memory compared to float64.
+            use_hashing (bool): Hash n-grams into n_features columns instead of building a
+                vocabulary, so memory does not grow with the vocabulary. max_df/min_df and
+                get_feature_names_out are not available in this mode.
+            n_features (int): Number of hashed features when use_hashing is True.
+            sublinear_tf (bool): Use 1 + log(tf) instead of raw term counts.
+        """
         self.max_df = max_df
         self.min_df = min_df
         self.ngram_range = ngram_range
+        self.dtype = dtype
+        self.use_hashing = use_hashing
+        self.n_features = n_features
+        self.sublinear_tf = sublinear_tf
         self.vectorizer = None
         self.tokenizerLambda = tokenizer
     
@@ -15,12 +38,31 @@ class TfidfVectorizer:
         return self.tokenizerLambda(text)
     
     def fit(self, texts):
-        self.vectorizer = SklearnTfidfVectorizer(
-            max_df=self.max_df,
-            min_df=self.min_df,
-            ngram_range=self.ngram_range,
-            tokenizer=self.tokenizer
-        )
+        if self.use_hashing:
+            self.vectorizer = Pipeline([
+                ('hash', HashingVectorizer(
+                    n_features=self.n_features,
+                    ngram_range=self.ngram_range,
+                    tokenizer=self.tokenizerLambda,
+                    token_pattern=None,
+                    alternate_sign=False,
+                    norm=None,  # Raw counts, TfidfTransformer normalizes
+                    dtype=self.dtype
+                )),
+                ('tfidf', TfidfTransformer(sublinear_tf=self.sublinear_tf))
+            ])
+        else:
+            self.vectorizer = SklearnTfidfVectorizer(
+                max_df=self.max_df,
+                min_df=self.min_df,
+                ngram_range=self.ngram_range,
+                # The raw callable, not the bound method, saves a Python call per document;
+                # token_pattern is unused with a custom tokenizer
+                tokenizer=self.tokenizerLambda,
+                token_pattern=None,
+                dtype=self.dtype,
+                sublinear_tf=self.sublinear_tf
+            )
         self.vectorizer.fit(texts)
         return self
     
@@ -38,11 +80,20 @@ class TfidfVectorizer:
     
     # Method to save the entire class instance
     def save(self, path):
-        with open(path, 'wb') as f:
-            dill.dump(self, f)
+        # joblib stores the NumPy arrays (idf vector) as raw buffers that load() can memory-map;
+        # custom tokenizers plain pickle can't handle (lambdas, closures) still go through dill
+        try:
+            joblib.dump(self, path)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            with open(path, 'wb') as f:
+                dill.dump(self, f)
     
     # Class method to load a saved instance
     @classmethod
-    def load(cls, path):
-        with open(path, 'rb') as f:
-            return dill.load(f)
\ No newline at end of file
+    def load(cls, path, mmap_mode='r'):
+        try:
+            return joblib.load(path, mmap_mode=mmap_mode)
+        except Exception:
+            # Saved with dill (custom tokenizer or older versions)
+            with open(path, 'rb') as f:
+                return dill.load(f)
\ No newline at end of file
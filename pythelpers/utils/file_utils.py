@@ -40,6 +40,11 @@ def get_timestamp_filename(base_name, extension=None, timestamp_format="%Y-%m-%d
     return f"{base_name}_{timestamp}"
 
 
+# Characters not allowed in filenames, deleted by str.translate
+_BAD_FILENAME_CHARS = str.maketrans('', '', '\\/*?:"<>|')
+_RE_UNDERSCORES = re.compile(r'[\s_]+')
+
+
 def safe_filename(filename):
     """
     Convert a string to a safe filename.
@@ -51,8 +56,8 @@ def safe_filename(filename):
         str: Safe filename
     """
     # Remove invalid chars
-    s = re.sub(r'[\\/*?:"<>|]', "", filename)
+    s = filename.translate(_BAD_FILENAME_CHARS)
     # Replace spaces and multiple underscores with single underscore
-    s = re.sub(r'[\s_]+', "_", s)
+    s = _RE_UNDERSCORES.sub("_", s)
     # Remove leading/trailing underscores and periods
     return s.strip("_.")
\ No newline at end of file
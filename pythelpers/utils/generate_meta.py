@@ -1,161 +1,591 @@
 #!/usr/bin/env python3
 import csv
 import json
+import random
 import argparse
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Union
 import re
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional, the json module is used instead
+    orjson = None
 
-def infer_column_type(column_name: str, values: List[Any], column_stats: Dict = None) -> str:
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:  # optional, pandas' own CSV parser is used instead
+    pa = pacsv = None
+
+try:
+    import polars as pl
+except ImportError:  # optional, pandas' to_numeric is used instead
+    pl = None
+
+# dtype kinds of string columns: object, and 'U' for Arrow-backed strings
+_STRING_KINDS = 'OU'
+
+# Rows per chunk when streaming the CSV
+CHUNK_SIZE = 200_000
+# Bytes per block parsed by pyarrow (one chunk per block)
+ARROW_BLOCK_SIZE = 16 << 20
+
+# Patterns are passed to the .str methods as .pattern strings, Arrow-backed columns do not take compiled ones
+# Date formats recognised by infer_column_type, fused into a single pattern
+_DATE_RE = re.compile('|'.join([
+    r'\d{4}-\d{2}-\d{2}',                   # ISO format: 2023-01-15
+    r'\d{2}/\d{2}/\d{4}',                   # MM/DD/YYYY
+    r'\d{2}-\d{2}-\d{4}',                   # MM-DD-YYYY
+    r'\w+\s+\d{1,2},\s+\d{4}'               # Month DD, YYYY
+]))
+# Formatting removed from numbers before parsing them
+_NUM_CLEAN_RE = re.compile(r'[,$%]')
+# NaN spellings float() accepts, to_numeric gives NaN for them and for unparseable strings alike
+_NAN_RE = re.compile(r'(?i)\s*[+-]?nan\s*')
+_WORD_RE = re.compile(r'\S+')
+_ID_SUFFIXES = ('id', 'key', 'code', 'uuid', 'guid', 'identifier')
+_ORDINAL_INDICATORS = ('grade', 'level', 'tier', 'class', 'rank', 'stage', 'step', 'education', 'year', 'rating')
+# Leading values checked before a full pass for boolean detection
+_BOOLEAN_PROBE_SIZE = 64
+_BOOLEAN_SETS = (
+    frozenset({'true', 'false'}),
+    frozenset({'t', 'f'}),
+    frozenset({'yes', 'no'}),
+    frozenset({'y', 'n'}),
+    frozenset({'1', '0'}),
+    frozenset({'1.0', '0.0'})
+)
+
+
+def _strip_strings(values: pd.Series) -> pd.Series:
+    """Stripped string values of a Series, NaN where the value is not a string"""
+    try:
+        stripped = values.str.strip()
+        if stripped.notna().any():
+            return stripped
+    except AttributeError:
+        pass
+    # No strings at all, still a string dtype so the .str methods keep working
+    return pd.Series(pd.NA, index=values.index, dtype='string')
+
+
+def _parse_numbers(strings: pd.Series) -> np.ndarray:
+    """
+    Parse formatted numbers ('1,234', '$5', '7%') from a Series of strings.
+    
+    Args:
+        strings: Stripped string values
+    
+    Returns:
+        np.ndarray: The values that parse as numbers, as float64 ('nan' and 'inf' count, as with float())
+    """
+    if strings.empty:
+        return np.empty(0, dtype=np.float64)
+    if pl is not None:
+        # Replace and cast run in polars' native kernels
+        parsed = (pl.from_pandas(strings).str.replace_all(_NUM_CLEAN_RE.pattern, '').str.strip_chars()
+                  .cast(pl.Float64, strict=False).drop_nulls())
+        return parsed.to_numpy()
+    # Remove commas and other formatting that might be in numbers
+    cleaned = strings.str.replace(_NUM_CLEAN_RE.pattern, '', regex=True)
+    # Arrow-backed strings parse to NaN rather than NA where they are not numbers, so test the floats
+    parsed = pd.to_numeric(cleaned, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = ~np.isnan(parsed) | cleaned.str.fullmatch(_NAN_RE.pattern, na=False).to_numpy(dtype=bool)
+    return parsed[valid]
+
+
+@lru_cache(maxsize=4096)
+def _classify_by_name(header: str) -> Optional[str]:
+    """
+    Column type forced by the column name, if any.
+    
+    Args:
+        header: The name of the column
+    
+    Returns:
+        Optional[str]: 'text' or 'categorical' for the manually overridden column patterns, None otherwise
+    """
+    if 'combined_tks' in header or header.endswith('_tks'):
+        return "text"
+    if header == 'id' or header.endswith('_id'):
+        return "categorical"
+    if header.startswith('category_') or 'category' in header.lower():
+        return "categorical"
+    return None
+
+
+def infer_column_type(column_name: str, values: Union[pd.Series, List[Any]], column_stats: Dict = None) -> str:
     """
     Infer the type of a column based on its values and name.
     
     Args:
         column_name: The name of the column
-        values: Sample values from the column
+        values: Sample values from the column, preferably as a pandas Series (missing values are ignored)
         column_stats: Additional statistics about the column (optional)
     
     Returns:
         str: The inferred column type: 'continuous', 'categorical', 'ordinal', 'text', etc.
     """
-    # Clean values by stripping whitespace and removing empty values
-    cleaned_values = [v.strip() if isinstance(v, str) else v for v in values if v is not None]
-    if not cleaned_values:
+    lname = column_name.lower()
+    
+    # Name-based overrides decide the type without looking at the values
+    forced_type = _classify_by_name(column_name)
+    if forced_type is not None:
+        return forced_type
+    
+    if not isinstance(values, pd.Series):
+        values = pd.Series(values, dtype=object)
+    if values.hasnans:
+        values = values.dropna()
+    if values.empty:
         return "categorical"  # Default if no valid values
     
     # Check for ID columns first
-    id_indicators = ['id', 'key', 'code', 'uuid', 'guid', 'identifier']
-    if column_name.lower() == 'id' or any(column_name.lower().endswith(f"_{ind}") or column_name.lower().endswith(f"{ind}") for ind in id_indicators):
+    if lname == 'id' or lname.endswith(_ID_SUFFIXES):
         return "categorical"
     
-    # Check for boolean columns
-    unique_strings = set(str(v).lower() for v in cleaned_values if v is not None)
-    boolean_sets = [
-        {'true', 'false'},
-        {'t', 'f'},
-        {'yes', 'no'},
-        {'y', 'n'},
-        {'1', '0'},
-        {'1.0', '0.0'}
-    ]
-    
-    for boolean_set in boolean_sets:
-        if unique_strings.issubset(boolean_set) and len(unique_strings) <= 2:
-            return "categorical"
+    # Columns pandas already parsed as numbers skip all string handling
+    native_numeric = values.dtype.kind in 'biuf'
+    if native_numeric:
+        stripped = None
+        # A view for float64 columns, a single conversion otherwise
+        numbers = values.to_numpy(dtype=np.float64, copy=False)
+    else:
+        if not pd.api.types.is_string_dtype(values.dtype):
+            values = values.astype(object)
+        # Clean values by stripping whitespace, non-string values are kept as they are
+        stripped = _strip_strings(values)
+        is_str = stripped.notna()
+    n_values = len(values)
+    
+    # Check for boolean columns, more than two distinct leading values already rule them out
+    unique_strings = None
+    if values.dtype.kind == 'b':
+        unique_strings = {'true', 'false'}
+    elif native_numeric:
+        if len(pd.unique(numbers[:_BOOLEAN_PROBE_SIZE])) <= 2:
+            unique_numbers = pd.unique(numbers)
+            if len(unique_numbers) <= 2 and np.isin(unique_numbers, (0.0, 1.0)).all() and not np.signbit(unique_numbers).any():
+                unique_strings = {'1', '0'}  # str() of 0/1 or 0.0/1.0, both boolean sets
+    else:
+        str_values = stripped.where(is_str, values).astype(str)
+        # Distinct string forms of the values, shared by the boolean and the unique value checks
+        distinct_strings = None
+        if str_values.iloc[:_BOOLEAN_PROBE_SIZE].str.lower().nunique() <= 2:
+            distinct_strings = pd.Series(str_values.unique())
+            unique_strings = set(distinct_strings.str.lower().unique())
+    if unique_strings is not None:
+        for boolean_set in _BOOLEAN_SETS:
+            if unique_strings.issubset(boolean_set) and len(unique_strings) <= 2:
+                return "categorical"
     
     # Check for text/tokens
-    if column_name.lower().endswith('_tks') or 'token' in column_name.lower() or 'text' in column_name.lower():
+    if lname.endswith('_tks') or 'token' in lname or 'text' in lname:
         # If the average string length is large, assume it's text
         if column_stats and 'mean_length' in column_stats and column_stats['mean_length'] > 20:
             return "text"
-        # Check if values typically contain multiple words
-        text_indicators = 0
-        for val in cleaned_values:
-            if isinstance(val, str) and len(val.split()) > 3:  # More than 3 words
-                text_indicators += 1
-        
-        if text_indicators > len(cleaned_values) * 0.3:  # If 30% of values appear to be text
-            return "text"
+        # Check if values typically contain multiple words (more than 3 words)
+        if stripped is not None:
+            text_indicators = (stripped.str.count(_WORD_RE.pattern) > 3).sum()
+            if text_indicators > n_values * 0.3:  # If 30% of values appear to be text
+                return "text"
     
     # Handle category column names
-    if 'category' in column_name.lower() or 'cat_' in column_name.lower() or column_name.lower().startswith('cat') or column_name.lower().endswith('_cat'):
+    if 'category' in lname or 'cat_' in lname or lname.startswith('cat') or lname.endswith('_cat'):
         return "categorical"
     
     # Try to convert to numeric
-    numeric_values = []
-    numeric_count = 0
-    for val in cleaned_values:
-        try:
-            if isinstance(val, str):
-                # Remove commas and other formatting that might be in numbers
-                cleaned = re.sub(r'[,$%]', '', val.strip())
-                if cleaned:
-                    num_val = float(cleaned)
-                    numeric_values.append(num_val)
-                    numeric_count += 1
-            elif isinstance(val, (int, float)):
-                numeric_values.append(float(val))
-                numeric_count += 1
-        except (ValueError, TypeError):
-            pass
+    if native_numeric:
+        numeric_values = numbers
+    else:
+        numeric_values = _parse_numbers(stripped[is_str])
+        others = values[~is_str]
+        if len(others):
+            # Mixed-type column: keep the Python numbers, checking each distinct type once instead of each value
+            value_types = others.map(type)
+            number_types = [t for t in value_types.unique() if issubclass(t, (int, float))]
+            others = others[value_types.isin(number_types)]
+            numeric_values = np.concatenate([numeric_values, others.to_numpy(dtype=np.float64)])
+    numeric_count = len(numeric_values)
     
     # If more than 70% of non-empty values are numeric
-    if numeric_count >= 0.7 * len(cleaned_values) and len(cleaned_values) > 0:
+    if numeric_count >= 0.7 * n_values and n_values > 0:
         # Check if the values are all integers or have very few unique values
         # compared to the total (suggesting categorical)
-        if numeric_values:
-            unique_values = set(numeric_values)
+        if numeric_count:
+            # Every NaN counts as its own value, as in a set of float('nan') results
+            nans = np.isnan(numeric_values)
+            unique_count = len(np.unique(numeric_values[~nans])) + int(nans.sum())
             # Check if all values are integers
-            all_ints = all(float(v).is_integer() for v in numeric_values)
+            all_ints = bool(np.all(np.isfinite(numeric_values) & (numeric_values == np.floor(numeric_values))))
             
             # If all integers and few unique values, might be categorical
-            if all_ints and len(unique_values) <= 10 and len(unique_values) < 0.2 * len(numeric_values):
+            if all_ints and unique_count <= 10 and unique_count < 0.2 * numeric_count:
                 return "categorical"
             
             # If small number of unique values, might be ordinal
-            if len(unique_values) <= 20 and len(unique_values) < 0.3 * len(numeric_values):
+            if unique_count <= 20 and unique_count < 0.3 * numeric_count:
                 return "ordinal"
             
             return "continuous"
     
     # Check for date patterns
-    date_count = 0
-    date_patterns = [
-        r'\d{4}-\d{2}-\d{2}',                   # ISO format: 2023-01-15
-        r'\d{2}/\d{2}/\d{4}',                   # MM/DD/YYYY
-        r'\d{2}-\d{2}-\d{4}',                   # MM-DD-YYYY
-        r'\w+\s+\d{1,2},\s+\d{4}'               # Month DD, YYYY
-    ]
-    
-    for val in cleaned_values:
-        if isinstance(val, str):
-            for pattern in date_patterns:
-                if re.search(pattern, val):
-                    date_count += 1
-                    break
-    
-    if date_count >= 0.7 * len(cleaned_values):
+    date_count = stripped.str.contains(_DATE_RE.pattern, na=False).sum()
+    
+    if date_count >= 0.7 * n_values:
         return "datetime"
     
     # Count unique values
-    unique_values = set(str(v) for v in cleaned_values)
+    if distinct_strings is None:
+        distinct_strings = str_values.unique()
+    unique_count = len(distinct_strings)
     
     # If very few unique values compared to total, likely categorical
-    if len(unique_values) <= 10 or len(unique_values) < 0.1 * len(cleaned_values):
+    if unique_count <= 10 or unique_count < 0.1 * n_values:
         return "categorical"
     
     # If moderate number of unique values, might be ordinal
-    if len(unique_values) <= 30 or len(unique_values) < 0.3 * len(cleaned_values):
+    if unique_count <= 30 or unique_count < 0.3 * n_values:
         # Names with indicators of ordinal nature
-        ordinal_indicators = ['grade', 'level', 'tier', 'class', 'rank', 'stage', 'step', 'education', 'year', 'rating']
-        for indicator in ordinal_indicators:
-            if indicator in column_name.lower():
+        for indicator in _ORDINAL_INDICATORS:
+            if indicator in lname:
                 return "ordinal"
     
     # Check for long text values
-    long_text_count = 0
-    for val in cleaned_values:
-        if isinstance(val, str) and len(val) > 100:  # Long text
-            long_text_count += 1
+    long_text_count = (stripped.str.len() > 100).sum()
     
-    if long_text_count > len(cleaned_values) * 0.2:  # If 20% are long text
+    if long_text_count > n_values * 0.2:  # If 20% are long text
         return "text"
     
     # Default to categorical for other scenarios
     return "categorical"
 
 
-def generate_metadata(csv_file_path: Path, output_json_path: Path, sample_size: int = None) -> None:
+def _infer_series_type(header: str, series: pd.Series) -> tuple:
+    """
+    Infer the type of a column from its name, dtype and values.
+    
+    Args:
+        header: The name of the column
+        series: The column values (may contain missing values)
+    
+    Returns:
+        tuple: The inferred column type and the column stats used for inference
+    """
+    # Name-based overrides decide the type without looking at the values
+    column_type = _classify_by_name(header)
+    kind = series.dtype.kind
+    
+    # Collect additional stats to help with type inference
+    column_stats = {}
+    
+    # Calculate string length stats for text detection
+    if kind in _STRING_KINDS and len(series):
+        # Get mean string length for text columns (missing values are not counted)
+        try:
+            str_lengths = series.str.len()
+            column_stats['mean_length'] = str_lengths.mean()
+            column_stats['max_length'] = str_lengths.max()
+        except:
+            pass
+    
+    if column_type is None:
+        if kind == 'b':
+            column_type = "categorical"
+        elif kind == 'M':
+            column_type = "datetime"
+        else:
+            # The Series itself, infer_column_type ignores missing values
+            column_type = infer_column_type(header, series, column_stats)
+    
+    return column_type, column_stats
+
+
+def _number_key(value) -> str:
+    """Key of a number in the value counts: integral values without a decimal point ('2' for 2 and 2.0)"""
+    if isinstance(value, (bool, np.bool_)) or not np.isfinite(value) or value != int(value) or abs(value) >= 2 ** 53:
+        return str(value)
+    return str(int(value))
+
+
+def _count_keys(index: pd.Index) -> pd.Index:
+    """
+    Value count keys as strings that do not depend on the dtype a chunk was parsed with.
+    
+    Args:
+        index: Distinct values of a column chunk
+    
+    Returns:
+        pd.Index: The values as strings, numbers in the form of _number_key
+    """
+    kind = index.dtype.kind
+    if kind == 'f':
+        values = index.to_numpy(dtype=np.float64)
+        integral = np.isfinite(values) & (values == np.floor(values)) & (np.abs(values) < 2 ** 53)
+        keys = values.astype(str).astype(object)
+        keys[integral] = values[integral].astype(np.int64).astype(str)
+        return pd.Index(keys, dtype=object)
+    if kind == 'O' and not isinstance(index.dtype, pd.StringDtype):
+        # Mixed values, numbers among them are keyed like those of numeric chunks
+        return pd.Index([_number_key(value) if isinstance(value, (int, float, np.number)) else str(value)
+                         for value in index], dtype=object)
+    return pd.Index(index.astype(str), dtype=object)
+
+
+def _update_column_stats(acc: Dict, column_type: str, series: pd.Series) -> None:
+    """
+    Fold one chunk of a column into its running statistics.
+    
+    Args:
+        acc: Running statistics of the column, updated in place
+        column_type: The inferred column type
+        series: The column values of the chunk
+    """
+    if column_type in ["categorical", "ordinal"]:
+        counts = series.value_counts(sort=False)
+        # Chunks of the same column may be parsed as different dtypes (1 in one, '1' in the next)
+        counts.index = _count_keys(counts.index)
+        if not counts.index.is_unique:
+            counts = counts.groupby(level=0, sort=False).sum()
+        acc["value_counts"] = counts if acc["value_counts"] is None else acc["value_counts"].add(counts, fill_value=0)
+    elif column_type == "text" and series.dtype.kind in _STRING_KINDS:
+        try:
+            lengths = series.str.len().dropna()
+        except AttributeError:
+            # No strings in this chunk (e.g. an all-null Arrow column)
+            return
+        if len(lengths):
+            acc["length_sum"] += float(lengths.sum())
+            acc["count"] += len(lengths)
+            acc["max_length"] = max(acc["max_length"], int(lengths.max()))
+
+
+def _to_numbers(series: pd.Series) -> pd.Series:
+    """Numeric values of a non-numeric column as float64, NaN where a value does not parse"""
+    try:
+        cleaned = series.str.replace(_NUM_CLEAN_RE.pattern, '', regex=True)
+    except AttributeError:
+        cleaned = series
+    # NumPy floats: an Arrow-backed result would hold NaN (not NA) for unparseable values,
+    # which min(), max() and sum() do not skip
+    numbers = pd.to_numeric(cleaned, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    return pd.Series(numbers, index=series.index)
+
+
+def _update_continuous_stats(accs: Dict, block: pd.DataFrame) -> None:
+    """
+    Fold one chunk of all continuous columns into their running statistics.
+    
+    Args:
+        accs: Running statistics per column, updated in place
+        block: The continuous columns of the chunk
+    """
+    # Formatted numbers ('1,234', '$5') or a later chunk parsed with another dtype than the first one
+    non_numeric = [header for header, dtype in block.dtypes.items() if dtype.kind not in 'iufb']
+    if non_numeric:
+        block = block.assign(**{header: _to_numbers(block[header]) for header in non_numeric})
+    
+    # One DataFrame-level reduction per statistic instead of one per column
+    counts, mins, maxs, sums = block.count(), block.min(), block.max(), block.sum()
+    for header, acc in accs.items():
+        if not counts[header]:
+            continue
+        low, high = float(mins[header]), float(maxs[header])
+        acc["min"] = low if acc["min"] is None else min(acc["min"], low)
+        acc["max"] = high if acc["max"] is None else max(acc["max"], high)
+        acc["sum"] += float(sums[header])
+        acc["count"] += int(counts[header])
+
+
+def _finite_or_none(value: Optional[float]) -> Optional[float]:
+    """A statistic as written to JSON: NaN and infinities become null, as orjson writes them"""
+    if value is None or not np.isfinite(value):
+        return None
+    return value
+
+
+def _top_k(counts: pd.Series, k: int = 10) -> Dict:
+    """
+    The k most common values without sorting all of them.
+    
+    Args:
+        counts: Unsorted value counts
+        k: Number of values to keep
+    
+    Returns:
+        Dict: The k most common values (as strings) and their counts, most common first
+    """
+    # JSON object keys are strings
+    return {str(value): int(count) for value, count in counts.nlargest(k).items()}
+
+
+def _column_meta(header: str, column_type: str, acc: Dict) -> Dict:
+    """
+    Build the metadata entry of a column from its running statistics.
+    
+    Args:
+        header: The name of the column
+        column_type: The inferred column type
+        acc: Running statistics of the column
+    
+    Returns:
+        Dict: The column metadata
+    """
+    column_meta = {
+        "name": header,
+        "type": column_type
+    }
+    
+    # Add additional statistics based on column type
+    if column_type == "continuous":
+        column_meta.update({
+            "min": _finite_or_none(acc["min"]),
+            "max": _finite_or_none(acc["max"]),
+            "mean": _finite_or_none(acc["sum"] / acc["count"] if acc["count"] else None),
+            "null_count": acc["null_count"]
+        })
+    elif column_type in ["categorical", "ordinal"]:
+        counts = acc["value_counts"] if acc["value_counts"] is not None else pd.Series(dtype=np.int64)
+        # Get value counts for the most common values
+        value_counts = _top_k(counts, 10)
+        column_meta.update({
+            "unique_values": len(counts),
+            "most_common": value_counts,
+            "null_count": acc["null_count"]
+        })
+    elif column_type == "text":
+        column_meta.update({
+            "avg_length": acc["length_sum"] / acc["count"] if acc["count"] else 0,
+            "max_length": acc["max_length"],
+            "null_count": acc["null_count"]
+        })
+    
+    return column_meta
+
+
+def _arrow_chunks(csv_file_path: Path, sample_size: int = None):
+    """
+    Parse a CSV file block by block with pyarrow's multithreaded reader.
+    
+    Args:
+        csv_file_path: Path to the input CSV file
+        sample_size: Number of rows to read (None = all rows)
+    
+    Yields:
+        pd.DataFrame: One chunk per parsed block
+    """
+    reader = pacsv.open_csv(
+        csv_file_path,
+        read_options=pacsv.ReadOptions(block_size=ARROW_BLOCK_SIZE),
+        # Empty fields are missing values, as with pd.read_csv
+        convert_options=pacsv.ConvertOptions(strings_can_be_null=True)
+    )
+    n_rows = 0
+    for batch in reader:
+        if sample_size is not None:
+            if n_rows >= sample_size:
+                break
+            batch = batch.slice(0, sample_size - n_rows)
+        n_rows += batch.num_rows
+        # Arrow-backed columns: no Python objects per string, dates keep a datetime kind
+        yield batch.to_pandas(types_mapper=pd.ArrowDtype)
+    if n_rows == 0:
+        # Header only, still report the columns
+        yield reader.schema.empty_table().to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _scan_chunks(csv_file_path: Path, chunks, full: bool = False) -> Dict:
+    """
+    Infer column types from the first chunk and accumulate the column statistics over all chunks.
+    
+    Args:
+        csv_file_path: Path to the input CSV file
+        chunks: Iterable of DataFrame chunks of the file
+        full: Whether to compute the column statistics (otherwise only names and types)
+    
+    Returns:
+        Dict: The metadata of the CSV file
+    """
+    n_rows = 0
+    columns = None
+    
+    for chunk in chunks:
+        if columns is None:
+            columns = {}
+            for header, series in chunk.items():
+                column_type, _ = _infer_series_type(header, series)
+                acc = {"null_count": 0, "count": 0, "min": None, "max": None, "sum": 0.0,
+                       "value_counts": None, "length_sum": 0.0, "max_length": 0}
+                columns[header] = (column_type, acc)
+            continuous = {header: acc for header, (column_type, acc) in columns.items() if column_type == "continuous"}
+        
+        chunk_rows = len(chunk)
+        if not chunk_rows or not full:
+            # Without statistics the remaining chunks are only counted
+            n_rows += chunk_rows
+            continue
+        # One pass over the chunk for the null counts of all columns
+        null_counts = chunk.isna().sum()
+        for header, series in chunk.items():
+            column_type, acc = columns[header]
+            acc["null_count"] += int(null_counts[header])
+            if column_type != "continuous":
+                _update_column_stats(acc, column_type, series)
+        if continuous:
+            _update_continuous_stats(continuous, chunk[list(continuous)])
+        n_rows += chunk_rows
+    
+    return {
+        "filename": str(csv_file_path),
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "rows_analyzed": n_rows,
+        "total_rows": n_rows,
+        "columns": [
+            _column_meta(header, column_type, acc) if full else {"name": header, "type": column_type}
+            for header, (column_type, acc) in (columns or {}).items()
+        ]
+    }
+
+
+def _scan_csv(csv_file_path: Path, sample_size: int = None, full: bool = False) -> Dict:
+    """
+    Stream a CSV file in chunks, parsed by pyarrow when available and by pandas otherwise.
+    
+    Args:
+        csv_file_path: Path to the input CSV file
+        sample_size: Number of rows to analyze (None = all rows)
+        full: Whether to compute the column statistics
+    
+    Returns:
+        Dict: The metadata of the CSV file
+    """
+    if pacsv is not None:
+        try:
+            return _scan_chunks(csv_file_path, _arrow_chunks(csv_file_path, sample_size), full)
+        except pa.ArrowInvalid as e:
+            # pyarrow fixes column types from the first block, later blocks may not fit them
+            print(f"pyarrow could not parse the CSV file ({str(e)}), using pandas instead")
+    
+    # Arrow-backed columns here too when pyarrow is available (the pyarrow engine itself does not support chunksize)
+    backend = {"dtype_backend": "pyarrow"} if pa is not None else {}
+    reader = pd.read_csv(csv_file_path, chunksize=CHUNK_SIZE, nrows=sample_size, low_memory=False, **backend)
+    return _scan_chunks(csv_file_path, reader, full)
+
+
+def generate_metadata(csv_file_path: Path, output_json_path: Path, sample_size: int = None, full: bool = False) -> None:
     """
     Generate a metadata JSON file from a CSV file.
     
     Args:
         csv_file_path: Path to the input CSV file
         output_json_path: Path to save the output JSON metadata
-        sample_size: Number of rows to sample for type inference (None = all rows)
+        sample_size: Number of rows to analyze (None = all rows)
+        full: Include the file info and column statistics in the output (default: column names and types only)
     """
     # Convert to Path objects if they're not already
     csv_file_path = Path(csv_file_path)
@@ -170,82 +600,8 @@ def generate_metadata(csv_file_path: Path, output_json_path: Path, sample_size:
     
     try:
         # Try using pandas for more robust CSV handling
-        # If sample_size is None, read the entire file
         print(f"Reading CSV file: {csv_file_path}")
-        if sample_size is None:
-            df = pd.read_csv(csv_file_path)
-        else:
-            df = pd.read_csv(csv_file_path, nrows=sample_size)
-            
-        headers = df.columns.tolist()
-        
-        # Create metadata structure
-        metadata = {
-            "filename": str(csv_file_path),
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "rows_analyzed": len(df),
-            "total_rows": len(df),
-            "columns": []
-        }
-        
-        for header in headers:
-            # Get non-null values for the column
-            values = df[header].dropna().tolist()
-            
-            # Collect additional stats to help with type inference
-            column_stats = {}
-            
-            # Calculate string length stats for text detection
-            if df[header].dtype == 'object':
-                # Get mean string length for text columns
-                try:
-                    str_lengths = df[header].astype(str).apply(len)
-                    column_stats['mean_length'] = str_lengths.mean()
-                    column_stats['max_length'] = str_lengths.max()
-                except:
-                    pass
-            
-            column_type = infer_column_type(header, values, column_stats)
-            
-            # Manually override types for specific column patterns
-            if header == 'id' or header.endswith('_id'):
-                column_type = "categorical"
-            
-            if header.startswith('category_') or 'category' in header.lower():
-                column_type = "categorical"
-            
-            if 'combined_tks' in header or header.endswith('_tks'):
-                column_type = "text"
-            
-            column_meta = {
-                "name": header,
-                "type": column_type
-            }
-            
-            # Add additional statistics based on column type
-            if column_type == "continuous":
-                column_meta.update({
-                    "min": float(df[header].min()) if not df[header].empty else None,
-                    "max": float(df[header].max()) if not df[header].empty else None,
-                    "mean": float(df[header].mean()) if not df[header].empty else None,
-                    "null_count": int(df[header].isna().sum())
-                })
-            elif column_type in ["categorical", "ordinal"]:
-                # Get value counts for the most common values
-                value_counts = df[header].value_counts().head(10).to_dict()
-                column_meta.update({
-                    "unique_values": len(df[header].unique()),
-                    "most_common": value_counts,
-                    "null_count": int(df[header].isna().sum())
-                })
-            elif column_type == "text":
-                column_meta.update({
-                    "avg_length": column_stats.get('mean_length', 0),
-                    "max_length": column_stats.get('max_length', 0),
-                    "null_count": int(df[header].isna().sum())
-                })
-            
-            metadata["columns"].append(column_meta)
+        metadata = _scan_csv(csv_file_path, sample_size, full)
         
     except Exception as e:
         print(f"Error using pandas: {str(e)}")
@@ -259,19 +615,26 @@ def generate_metadata(csv_file_path: Path, output_json_path: Path, sample_size:
                 headers = next(reader)
                 headers = [h.strip() for h in headers]
                 
-                # Read all rows if sample_size is None
-                all_rows = list(reader) if sample_size is None else []
-                
-                # If we're sampling, just get those rows
-                if sample_size is not None and not all_rows:
-                    for i, row in enumerate(reader):
-                        if i >= sample_size:
-                            break
-                        all_rows.append(row)
+                # Keep the first sample_size rows, or without sample_size a uniform
+                # sample (reservoir, Algorithm R) of CHUNK_SIZE rows of the whole file
+                reservoir_size = CHUNK_SIZE if sample_size is None else sample_size
+                rng = random.Random(0)
+                sample_rows = []
+                rows_seen = 0
+                for row in reader:
+                    if sample_size is not None and rows_seen >= sample_size:
+                        break
+                    if rows_seen < reservoir_size:
+                        sample_rows.append(row)
+                    else:
+                        k = rng.randint(0, rows_seen)
+                        if k < reservoir_size:
+                            sample_rows[k] = row
+                    rows_seen += 1
                 
                 # Sample the data for type inference
                 sample_data = {header: [] for header in headers}
-                for row in all_rows:
+                for row in sample_rows:
                     for j, header in enumerate(headers):
                         if j < len(row):
                             sample_data[header].append(row[j])
@@ -280,20 +643,14 @@ def generate_metadata(csv_file_path: Path, output_json_path: Path, sample_size:
             metadata = {
                 "filename": str(csv_file_path),
                 "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "rows_analyzed": len(all_rows),
-                "total_rows": len(all_rows),
+                "rows_analyzed": rows_seen,
+                "total_rows": rows_seen,
                 "columns": []
             }
             
             for header in headers:
-                # Manually override types for specific column patterns
-                if header == 'id' or header.endswith('_id'):
-                    column_type = "categorical"
-                elif header.startswith('category_') or 'category' in header.lower():
-                    column_type = "categorical"
-                elif 'combined_tks' in header or header.endswith('_tks'):
-                    column_type = "text"
-                else:
+                column_type = _classify_by_name(header)
+                if column_type is None:
                     column_type = infer_column_type(header, sample_data[header])
                 
                 metadata["columns"].append({
@@ -309,23 +666,16 @@ def generate_metadata(csv_file_path: Path, output_json_path: Path, sample_size:
         # Create output directory if it doesn't exist
         output_json_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # If we want to use "text" as a type, uncomment the following code
-        # For the simplified output, map "text" to "categorical" to match the desired format
-        simplified = {
-            "columns": [
-                {
-                    "name": col["name"],
-                    # Map "text" type to "categorical" if needed to match the requested format
-                    # "type": "categorical" if col["type"] == "text" else col["type"]
-                    "type": col["type"]
-                }
-                for col in metadata["columns"]
-            ]
-        }
+        # Without --full the columns already hold only names and types, nothing to strip
+        output = metadata if full else {"columns": metadata["columns"]}
         
-        # Write metadata to JSON file
-        with open(output_json_path, 'w') as jsonfile:
-            json.dump(simplified, jsonfile, indent=4)
+        # Write metadata to JSON file: UTF-8 with a 2-space indent either way (the only
+        # indent orjson supports); float formatting may differ in the exponent notation
+        if orjson is not None:
+            output_json_path.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_json_path, 'w', encoding='utf-8') as jsonfile:
+                json.dump(output, jsonfile, indent=2, ensure_ascii=False)
         
         print(f"Metadata file successfully generated at {output_json_path}")
         print(f"Analyzed {metadata['rows_analyzed']} rows from {csv_file_path}")
@@ -362,7 +712,8 @@ def main():
     generate_metadata(
         csv_file_path=csv_file_path,
         output_json_path=output_path,
-        sample_size=args.sample
+        sample_size=args.sample,
+        full=args.full
     )
 
 
@@ -0,0 +1,23 @@
+import numpy as np
+
+from pythelpers.ml.df import _histogram_densities
+
+
+def test_histogram_densities_match_numpy_on_integer_data():
+    # 0..44 in 20 bins puts many values exactly on bin edges
+    values = np.column_stack([np.arange(45.0), np.arange(45.0)[::-1] * 3 - 7])
+    result = _histogram_densities(values)
+    for col in range(values.shape[1]):
+        expected = np.histogram(values[:, col], bins=20, density=True)[0]
+        np.testing.assert_array_equal(result[col], expected)
+
+
+def test_histogram_densities_skip_non_finite_and_constant_columns():
+    values = np.array([[1.0, 5.0, np.nan],
+                       [2.0, 5.0, np.nan],
+                       [np.nan, 5.0, np.nan],
+                       [np.inf, 5.0, np.nan]])
+    result = _histogram_densities(values)
+    np.testing.assert_array_equal(result[0], np.histogram([1.0, 2.0], bins=20, density=True)[0])
+    np.testing.assert_array_equal(result[1], np.histogram([5.0] * 4, bins=20, density=True)[0])
+    assert np.isnan(result[2]).all()
@@ -0,0 +1,123 @@
+import json
+
+import pandas as pd
+import pytest
+
+from pythelpers.utils import generate_meta
+from pythelpers.utils.generate_meta import infer_column_type
+
+
+@pytest.fixture(params=['polars', 'pandas'])
+def number_parser(request, monkeypatch):
+    """Run a test with both _parse_numbers backends"""
+    if request.param == 'polars':
+        if generate_meta.pl is None:
+            pytest.skip("polars is not installed")
+    else:
+        monkeypatch.setattr(generate_meta, 'pl', None)
+    return request.param
+
+
+def test_nan_and_inf_strings_count_as_numbers(number_parser):
+    # float() accepts these spellings, so they count towards the numeric share
+    values = ['nan', 'NaN', ' -nan ', 'inf', '-Infinity', '1.5', '2.5', '3.5']
+    assert infer_column_type('score', values) == 'continuous'
+    assert infer_column_type('score', pd.Series(values, dtype=object)) == 'continuous'
+
+
+def test_each_nan_string_is_a_distinct_value(number_parser):
+    # Six numbers in 30 values would be ordinal, the NaNs push the unique count up
+    values = ['nan'] * 10 + [str(i % 6) + '.5' for i in range(20)]
+    assert infer_column_type('score', values) == 'continuous'
+    assert infer_column_type('score', [str(i % 6) + '.5' for i in range(30)]) == 'ordinal'
+
+
+@pytest.fixture(params=['numpy', 'pyarrow'])
+def chunked_reader(request, monkeypatch):
+    """Read CSV files with pandas in small chunks, with and without Arrow-backed columns"""
+    monkeypatch.setattr(generate_meta, 'CHUNK_SIZE', 50)
+    monkeypatch.setattr(generate_meta, 'pacsv', None)
+    if request.param == 'pyarrow':
+        if generate_meta.pa is None:
+            pytest.skip("pyarrow is not installed")
+    else:
+        monkeypatch.setattr(generate_meta, 'pa', None)
+    return request.param
+
+
+def _column_stats(tmp_path, rows, name='level'):
+    csv_path = tmp_path / 'data.csv'
+    csv_path.write_text(name + '\n' + '\n'.join(rows) + '\n')
+    json_path = tmp_path / 'meta.json'
+    generate_meta.generate_metadata(csv_path, json_path, full=True)
+    return json.loads(json_path.read_text())['columns'][0]
+
+
+def test_value_counts_merge_across_drifting_chunks(tmp_path, chunked_reader):
+    # The first chunk parses as integers, the second one as strings
+    rows = [str(i % 8 + 1) for i in range(99)] + ['abc']
+    column = _column_stats(tmp_path, rows)
+    assert column['type'] == 'categorical'
+    assert column['unique_values'] == 9
+    expected = pd.Series(rows).value_counts()
+    assert column['most_common'] == {key: int(count) for key, count in expected.items()}
+
+
+@pytest.mark.parametrize('serializer', ['orjson', 'json'])
+def test_json_output_is_utf8_without_non_finite_numbers(tmp_path, monkeypatch, serializer):
+    if serializer == 'json':
+        monkeypatch.setattr(generate_meta, 'orjson', None)
+    elif generate_meta.orjson is None:
+        pytest.skip("orjson is not installed")
+    csv_path = tmp_path / 'data.csv'
+    rows = [f'{city},{i + 0.5}' for i, city in enumerate(['Zürich', 'Köln', 'Malmö'] * 20)]
+    csv_path.write_text('city,score\n' + '\n'.join(rows + ['Köln,inf']) + '\n', encoding='utf-8')
+    json_path = tmp_path / 'meta.json'
+    generate_meta.generate_metadata(csv_path, json_path, full=True)
+    text = json_path.read_text(encoding='utf-8')
+    assert 'Zürich' in text
+    assert 'Infinity' not in text and 'NaN' not in text
+    city, score = json.loads(text)['columns']
+    assert city['most_common'] == {'Köln': 21, 'Zürich': 20, 'Malmö': 20}
+    assert score['type'] == 'continuous'
+    assert score['min'] == 0.5 and score['max'] is None and score['mean'] is None
+
+
+def test_arrow_backed_strings_without_polars(tmp_path, monkeypatch, capsys):
+    pytest.importorskip('pyarrow')
+    # Arrow-backed strings take the pandas path of _parse_numbers and _to_numbers
+    monkeypatch.setattr(generate_meta, 'pl', None)
+    csv_path = tmp_path / 'data.csv'
+    header = 'city,hex,when,amount'
+    rows = [f'{city},{i * 7919:x}z,{i % 12 + 1:02d}/{i % 28 + 1:02d}/2023,"${i * 13 % 97},000.5"'
+            for i, city in enumerate(['Berlin', 'Paris', 'Rome', 'Oslo'] * 25)]
+    rows[-1] = 'Rome,ffz,01/01/2023,n/a'
+    csv_path.write_text(header + '\n' + '\n'.join(rows) + '\n')
+    json_path = tmp_path / 'meta.json'
+    generate_meta.generate_metadata(csv_path, json_path, full=True)
+    assert 'Falling back' not in capsys.readouterr().out
+    columns = {column['name']: column for column in json.loads(json_path.read_text())['columns']}
+    assert columns['city']['type'] == 'categorical'
+    assert columns['hex']['type'] == 'categorical'
+    assert columns['when']['type'] == 'datetime'
+    amount = columns['amount']
+    assert amount['type'] == 'continuous'
+    expected = [i * 13 % 97 * 1000 + 0.5 for i in range(99)]
+    assert amount['min'] == min(expected) and amount['max'] == max(expected)
+    assert amount['mean'] == pytest.approx(sum(expected) / len(expected))
+
+
+@pytest.mark.parametrize('reader', ['pyarrow', 'pandas-pyarrow', 'pandas'])
+def test_value_count_keys_do_not_depend_on_the_reader(tmp_path, monkeypatch, reader):
+    if reader != 'pandas' and generate_meta.pa is None:
+        pytest.skip("pyarrow is not installed")
+    if reader != 'pyarrow':
+        monkeypatch.setattr(generate_meta, 'pacsv', None)
+    if reader == 'pandas':
+        monkeypatch.setattr(generate_meta, 'pa', None)
+    # Integers with missing values: int64 for Arrow, float64 for NumPy-backed pandas
+    rows = [str(i % 3) if i % 10 else '' for i in range(100)]
+    column = _column_stats(tmp_path, rows)
+    assert column['type'] == 'categorical'
+    assert column['unique_values'] == 3
+    assert set(column['most_common']) == {'0', '1', '2'}
@@ -0,0 +1,137 @@
+import io
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from pythelpers.logger.logger import DEFAULT_FORMAT, TeeLogger
+
+
+@pytest.fixture
+def tee(tmp_path, monkeypatch):
+    logger = TeeLogger("test.log", logs_dirpath=str(tmp_path))
+    flushes = []
+    monkeypatch.setattr(logger, "flush", lambda: flushes.append(True))
+    yield logger, flushes
+    monkeypatch.undo()
+    logger.close()
+
+
+def _format(level, message):
+    record = logging.LogRecord("test", level, __file__, 0, message, None, None)
+    return logging.Formatter(DEFAULT_FORMAT).format(record) + "\n"
+
+
+def test_error_record_flushes(tee):
+    logger, flushes = tee
+    logger.write(_format(logging.ERROR, "boom"))
+    logger.write(_format(logging.CRITICAL, "boom"))
+    assert len(flushes) == 2
+
+
+def test_error_words_in_message_do_not_flush(tee):
+    logger, flushes = tee
+    logger.write("No ERRORS found\n")
+    logger.write("CRITICALITY: low\n")
+    logger.write(_format(logging.INFO, "ERROR count: 0"))
+    assert flushes == []
+
+
+def test_output_of_later_atexit_handlers_is_kept(tmp_path):
+    # Handlers registered before start_logging run after the logger's own exit handler
+    script = (
+        "import atexit\n"
+        "atexit.register(print, 'printed at exit')\n"
+        "from pythelpers.logger.logger import start_logging\n"
+        f"start_logging(logs_dirpath={str(tmp_path)!r})\n"
+        "print('printed while running')\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True,
+                            cwd=Path(__file__).resolve().parents[1], check=True)
+    assert result.stdout.endswith("printed while running\nprinted at exit\n")
+    log_text = next(tmp_path.glob("*.log")).read_text()
+    assert log_text.endswith("printed while running\nprinted at exit\n")
+
+
+def test_write_after_close_reaches_the_terminal(tmp_path, monkeypatch):
+    terminal = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", terminal)
+    logger = TeeLogger("test.log", logs_dirpath=str(tmp_path))
+    logger.write("before close\n")
+    logger.close()
+    logger.write("after close\n")
+    logger.flush()
+    assert terminal.getvalue().endswith("before close\nafter close\n")
+    assert (tmp_path / "test.log").read_text() == "before close\n"
+
+
+class _NotebookStream(io.StringIO):
+    """Text stream whose fileno() is not where its text goes, like ipykernel's OutStream"""
+    encoding = "UTF-8"
+
+    def __init__(self, fd):
+        super().__init__()
+        self._fd = fd
+
+    def fileno(self):
+        return self._fd
+
+
+def test_streams_with_a_foreign_fileno_get_text_writes(tmp_path, monkeypatch):
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    terminal = _NotebookStream(write_fd)
+    monkeypatch.setattr(sys, "stdout", terminal)
+    try:
+        logger = TeeLogger("test.log", logs_dirpath=str(tmp_path))
+        logger.write("into the cell\n")
+        logger.close()
+        assert terminal.getvalue().endswith("into the cell\n")
+        with pytest.raises(BlockingIOError):
+            os.read(read_fd, 1024)
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def _iouring_logger(tmp_path):
+    pytest.importorskip("liburing")
+    logger = TeeLogger("test.log", logs_dirpath=str(tmp_path), backend="iouring")
+    if logger._file_writer is None:
+        logger.close()
+        pytest.skip("io_uring is not available")
+    return logger
+
+
+def test_iouring_backend_round_trip(tmp_path, capfd):
+    logger = _iouring_logger(tmp_path)
+    lines = [f"line {i} {'x' * (i % 50)}\n" for i in range(2000)]
+    for line in lines:
+        logger.write(line)
+    logger.flush()
+    logger.write("after flush\n")
+    logger.close()
+    expected = "".join(lines) + "after flush\n"
+    assert (tmp_path / "test.log").read_text() == expected
+    assert capfd.readouterr().out.endswith(expected)
+
+
+def test_iouring_write_failure_falls_back_to_writev(tmp_path, monkeypatch, capfd):
+    logger = _iouring_logger(tmp_path)
+    logger.write("before\n")
+    logger.flush()
+
+    def broken_prep_write(*args):
+        raise TypeError("wrong signature")
+
+    monkeypatch.setattr(logger._file_writer._uring, "io_uring_prep_write", broken_prep_write)
+    logger.write("failing batch\n")
+    logger.flush()
+    logger.write("later batch\n")
+    logger.close()
+    assert logger._file_writer is None
+    assert (tmp_path / "test.log").read_text().endswith("before\nfailing batch\nlater batch\n")
+    assert "using os.writev" in capfd.readouterr().err